@@ -4,10 +4,12 @@ import argparse
 import json
 import subprocess
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import IO, List, Optional, Set, Tuple
 
 COMMANDS = [
     "/sdd-init",
@@ -25,6 +27,15 @@ COMMANDS = [
     "/worktree",
 ]
 
+EXPECTED_KEYS = (
+    "phase:",
+    "must_read:",
+    "gates:",
+    "stops:",
+    "skills_to_load:",
+    "next:",
+)
+
 
 @dataclass(frozen=True)
 class Result:
@@ -42,43 +53,54 @@ class Result:
     error: Optional[str]
 
 
-def _loads_json_lines(text: str) -> List[Dict[str, Any]]:
-    out: List[Dict[str, Any]] = []
-    for line in text.splitlines():
-        line = line.strip()
+@dataclass(frozen=True)
+class EventScan:
+    last_text: Optional[str]
+    parse_error: Optional[str]
+    out_chars: int
+    out_lines: int
+
+
+def _scan_json_events(stream: IO[str]) -> EventScan:
+    """Parse JSON events line by line as they arrive, keeping the last text part.
+
+    After the first malformed line parsing stops, but the stream is still
+    drained so the child never blocks on a full pipe.
+    """
+    last: Optional[str] = None
+    parse_error: Optional[str] = None
+    out_chars = 0
+    out_lines = 0
+    for raw in stream:
+        out_chars += len(raw)
+        out_lines += len(raw.splitlines())
+        if parse_error is not None:
+            continue
+        line = raw.strip()
         if not line:
             continue
         # Some OpenCode builds may print non-JSON logs; ignore them.
         if not line.startswith("{"):
             continue
-        out.append(json.loads(line))
-    return out
-
-
-def _extract_last_text(events: List[Dict[str, Any]]) -> Optional[str]:
-    last: Optional[str] = None
-    for e in events:
+        try:
+            e = json.loads(line)
+        except Exception as exc:  # noqa: BLE001
+            parse_error = str(exc)
+            continue
         if e.get("type") != "text":
             continue
         part = e.get("part") or {}
         t = part.get("text")
         if isinstance(t, str):
             last = t
-    return last
+    return EventScan(last, parse_error, out_chars, out_lines)
 
 
 def _check_output(s: str) -> Tuple[bool, bool, bool, bool, bool, bool]:
     repo_root = Path(__file__).resolve().parents[1]
 
     lines = s.splitlines()
-    expected_keys = [
-        "phase:",
-        "must_read:",
-        "gates:",
-        "stops:",
-        "skills_to_load:",
-        "next:",
-    ]
+    expected_keys = EXPECTED_KEYS
 
     has_code_fence = "```" in s
     has_triple_dash = "---" in s
@@ -90,9 +112,14 @@ def _check_output(s: str) -> Tuple[bool, bool, bool, bool, bool, bool]:
     )
 
     has_template = lines[:1] == ["[Context Pack v1]"]
-    has_required_keys = all(
-        any(line.startswith(k) for line in lines) for k in expected_keys
-    )
+    # One pass over lines; the tuple startswith skips non-key lines in C.
+    seen_keys: Set[str] = set()
+    for line in lines:
+        if line.startswith(expected_keys):
+            seen_keys.update(k for k in expected_keys if line.startswith(k))
+            if len(seen_keys) == len(expected_keys):
+                break
+    has_required_keys = len(seen_keys) == len(expected_keys)
 
     has_evidence_paths = has_fixed_format
     if has_evidence_paths:
@@ -100,21 +127,23 @@ def _check_output(s: str) -> Tuple[bool, bool, bool, bool, bool, bool]:
             line = lines[i + 1]
 
             # Require exactly one trailing evidence pointer: (...)
-            if line.count("(") != 1 or line.count(")") != 1 or (not line.endswith(")")):
-                has_evidence_paths = False
-                break
-
-            left = line.rfind("(")
-            if left < 0:
+            before, lparen, rest = line.partition("(")
+            if (
+                not lparen
+                or not rest.endswith(")")
+                or "(" in rest
+                or ")" in before
+                or ")" in rest[:-1]
+            ):
                 has_evidence_paths = False
                 break
 
-            value = line[len(key) : left].strip()
+            value = before[len(key) :].strip()
             if not value:
                 has_evidence_paths = False
                 break
 
-            evidence = line[left + 1 : -1]
+            evidence = rest[:-1]
             if (not evidence) or (evidence.strip() != evidence):
                 has_evidence_paths = False
                 break
@@ -166,15 +195,34 @@ def run_one(
     ]
 
     start = time.monotonic()
-    try:
-        proc = subprocess.run(  # noqa: S603
-            cmd,
-            text=True,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            timeout=timeout_s,
-        )
-    except subprocess.TimeoutExpired:
+    timed_out = threading.Event()
+    stderr_parts: List[str] = []
+    with subprocess.Popen(  # noqa: S603
+        cmd,
+        text=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    ) as proc:
+        stdout, stderr = proc.stdout, proc.stderr
+        if stdout is None or stderr is None:
+            raise RuntimeError("opencode pipes were not created")
+
+        def kill_on_timeout() -> None:
+            timed_out.set()
+            proc.kill()
+
+        timer = threading.Timer(timeout_s, kill_on_timeout)
+        drain = threading.Thread(target=lambda: stderr_parts.append(stderr.read()))
+        timer.start()
+        drain.start()
+        try:
+            scan = _scan_json_events(stdout)
+            drain.join()
+            returncode = proc.wait()
+        finally:
+            timer.cancel()
+
+    if timed_out.is_set():
         return Result(
             command=command,
             ok=False,
@@ -192,7 +240,7 @@ def run_one(
 
     wall_ms = int((time.monotonic() - start) * 1000)
 
-    if proc.returncode != 0:
+    if returncode != 0:
         return Result(
             command=command,
             ok=False,
@@ -205,28 +253,26 @@ def run_one(
             has_evidence_paths=False,
             has_code_fence=False,
             has_triple_dash=False,
-            error=f"opencode exited with {proc.returncode}: {proc.stderr.strip()}",
+            error=f"opencode exited with {returncode}: {''.join(stderr_parts).strip()}",
         )
 
-    try:
-        events = _loads_json_lines(proc.stdout)
-    except Exception as e:  # noqa: BLE001
+    if scan.parse_error is not None:
         return Result(
             command=command,
             ok=False,
             duration_ms=wall_ms,
-            out_chars=len(proc.stdout),
-            out_lines=len(proc.stdout.splitlines()),
+            out_chars=scan.out_chars,
+            out_lines=scan.out_lines,
             has_template=False,
             has_required_keys=False,
             has_fixed_format=False,
             has_evidence_paths=False,
             has_code_fence=False,
             has_triple_dash=False,
-            error=f"failed to parse json events: {e}",
+            error=f"failed to parse json events: {scan.parse_error}",
         )
 
-    out = _extract_last_text(events)
+    out = scan.last_text
     duration_ms = wall_ms
     if out is None:
         return Result(
@@ -303,7 +349,16 @@ def main() -> int:
         default=[],
         help="Only run a specific command token (repeatable), e.g. --only /estimation",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=4,
+        help="Commands to run concurrently (default: 4)",
+    )
     args = parser.parse_args()
+    if args.jobs < 1:
+        print("--jobs must be >= 1", file=sys.stderr)
+        return 2
 
     targets = COMMANDS
     if args.only:
@@ -314,9 +369,11 @@ def main() -> int:
             print(f"unknown --only: {', '.join(missing)}", file=sys.stderr)
             return 2
 
-    results: List[Result] = []
-    for c in targets:
-        results.append(run_one(args.agent, args.model, c, args.timeout))
+    # Each run is an independent subprocess; map() keeps results in target order.
+    with ThreadPoolExecutor(max_workers=min(args.jobs, len(targets) or 1)) as ex:
+        results: List[Result] = list(
+            ex.map(lambda c: run_one(args.agent, args.model, c, args.timeout), targets)
+        )
 
     print(
         "command\tok\tduration_s\tchars\tlines\ttemplate\tkeys\tfixed7\tevidence_path\tno_code_fence\tno_triple_dash"
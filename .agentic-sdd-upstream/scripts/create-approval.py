@@ -1,7 +1,6 @@
 #!/usr/bin/env python3
 
 import argparse
-import hashlib
 import json
 import os
 import re
@@ -11,7 +10,12 @@ import sys
 from datetime import datetime, timezone
 from typing import Any
 
-from approval_constants import MODE_ALLOWED, MODE_SOURCE_ALLOWED
+from approval_constants import (
+    MODE_ALLOWED,
+    MODE_SOURCE_ALLOWED,
+    sha256_normalized_file,
+)
+from repo_root_cache import cached_repo_root
 
 
 def eprint(msg: str) -> None:
@@ -25,7 +29,7 @@ def now_utc_z() -> str:
     )
 
 
-def git_repo_root() -> str:
+def _git_toplevel() -> str:
     git_bin = shutil.which("git")
     if not git_bin:
         raise RuntimeError("git not found on PATH")
@@ -43,17 +47,11 @@ def git_repo_root() -> str:
     return os.path.realpath(root)
 
 
-def normalize_text_for_hash(text: str) -> bytes:
-    text = text.replace("\r\n", "\n").replace("\r", "\n")
-    if not text.endswith("\n"):
-        text += "\n"
-    return text.encode("utf-8")
-
-
-def sha256_prefixed(data: bytes) -> str:
-    h = hashlib.sha256()
-    h.update(data)
-    return f"sha256:{h.hexdigest()}"
+def git_repo_root() -> str:
+    root = cached_repo_root(_git_toplevel)
+    if not root:
+        raise RuntimeError("Not in a git repository; cannot locate repo root.")
+    return root
 
 
 def approval_dir(repo_root: str, issue_number: int) -> str:
@@ -64,19 +62,14 @@ def ensure_parent_dir(path: str) -> None:
     os.makedirs(os.path.dirname(path), exist_ok=True)
 
 
-def read_utf8_text(path: str) -> str:
-    with open(path, "r", encoding="utf-8") as fh:
-        return fh.read()
-
-
 def write_json(path: str, obj: dict[str, Any], force: bool) -> None:
     if os.path.exists(path) and not force:
         raise FileExistsError(f"File already exists: {path} (use --force to overwrite)")
     ensure_parent_dir(path)
+    data = json.dumps(obj, ensure_ascii=False, indent=2, sort_keys=True) + "\n"
     tmp = f"{path}.tmp"
-    with open(tmp, "w", encoding="utf-8") as fh:
-        fh.write(json.dumps(obj, ensure_ascii=False, indent=2, sort_keys=True))
-        fh.write("\n")
+    with open(tmp, "wb") as fh:
+        fh.write(data.encode("utf-8"))
     os.replace(tmp, path)
 
 
@@ -156,13 +149,11 @@ def main() -> int:
         return 2
 
     try:
-        estimate_text = read_utf8_text(estimate_md)
+        estimate_hash = sha256_normalized_file(estimate_md)
     except Exception as exc:  # noqa: BLE001
         eprint(f"Failed to read estimate.md (utf-8 required): {exc}")
         return 2
 
-    estimate_hash = sha256_prefixed(normalize_text_for_hash(estimate_text))
-
     record = {
         "schema_version": 1,
         "issue_number": args.issue,
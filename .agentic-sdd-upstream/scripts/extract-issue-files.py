@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 
 import argparse
+import functools
 import json
 import os
 import re
@@ -8,6 +9,14 @@ import subprocess
 import sys
 from typing import List, Sequence, Set, Tuple
 
+from gh_cache import GH_CACHE_TTL_SECONDS, cached_gh_fetch
+
+# Markdown link: [text](target)
+MD_LINK_RE = re.compile(r"\[[^\]]*\]\(([^)]+)\)")
+
+# Only text that opens with an object can be `gh issue view --json body` output
+JSON_OBJECT_START_RE = re.compile(r"\s*\{")
+
 
 def eprint(msg: str) -> None:
     print(msg, file=sys.stderr)
@@ -35,7 +44,7 @@ def normalize_reference(ref: str) -> str:
     ref = ref.strip()
 
     # Markdown link: [text](target)
-    m = re.search(r"\[[^\]]*\]\(([^)]+)\)", ref)
+    m = MD_LINK_RE.search(ref)
     if m:
         ref = m.group(1).strip()
 
@@ -52,6 +61,11 @@ def normalize_reference(ref: str) -> str:
     return ref
 
 
+@functools.lru_cache(maxsize=None)
+def _realpath(path: str) -> str:
+    return os.path.realpath(path)
+
+
 def resolve_ref_to_repo_path(repo_root: str, ref: str) -> str:
     ref = normalize_reference(ref)
     if not ref:
@@ -62,8 +76,8 @@ def resolve_ref_to_repo_path(repo_root: str, ref: str) -> str:
         raise ValueError(f"unsupported URL reference: {ref}")
 
     if os.path.isabs(ref):
-        abs_path = os.path.realpath(ref)
-        repo_abs = os.path.realpath(repo_root)
+        abs_path = _realpath(ref)
+        repo_abs = _realpath(repo_root)
         if not abs_path.startswith(repo_abs + os.sep):
             raise ValueError(f"absolute path outside repo: {ref}")
         rel = os.path.relpath(abs_path, repo_abs).replace(os.sep, "/")
@@ -102,64 +116,78 @@ def gh_issue_body(issue: str, gh_repo: str) -> str:
     return body
 
 
+def cached_gh_issue_body(issue: str, gh_repo: str) -> str:
+    """gh_issue_body with a short-lived on-disk cache (GH_CACHE_TTL_SECONDS)."""
+    # Without -R, gh picks the repo from the cwd, so the cwd is part of the key.
+    scope = gh_repo or f"cwd:{os.getcwd()}"
+    data = cached_gh_fetch(
+        "gh-issue",
+        scope,
+        issue,
+        ("body",),
+        lambda: {"body": gh_issue_body(issue, gh_repo)},
+    )
+    return data["body"]
+
+
+# Section scans run over the lines joined with "\n", so whitespace classes
+# exclude "\n" to keep every match within one line.
 HEADING_RE = re.compile(
-    r"^(#{2,6})\s*(変更対象ファイル[^\n]*|Change\s+targets?[^\n]*)\s*$"
+    r"^(#{2,6})[^\S\n]*(変更対象ファイル|Change[^\S\n]+targets?)",
+    re.MULTILINE,
 )
 
-# Backtick-wrapped paths are the canonical, deterministic form.
-BACKTICK_RE = re.compile(r"`([^`]+)`")
-
-# Limited fallback: only bullet-ish lines, only paths containing '/'.
-BULLET_PATH_RE = re.compile(
-    r"^\s*[-*]\s*(?:\[[ xX]\]\s*)?(?P<path>(?:[A-Za-z0-9._-]+/)+[A-Za-z0-9._-]+)\s*$"
+# A heading at level <= N ends a section opened by a level-N HEADING_RE match.
+SECTION_END_RES = {
+    level: re.compile(rf"^#{{1,{level}}}[^\S\n]", re.MULTILINE) for level in range(2, 7)
+}
+
+# Backtick-wrapped paths are the canonical, deterministic form.  Limited
+# fallback: only bullet-ish lines, only paths containing '/'.  Both forms are
+# matched in one pass over the newline-joined lines; neither alternative may
+# cross a line break, and a bullet path cannot contain a backtick, so lines
+# with backtick spans never yield a bullet match.
+PATH_REF_RE = re.compile(
+    r"`(?P<code>[^`\n]+)`"
+    r"|^[^\S\n]*[-*][^\S\n]*(?:\[[ xX]\][^\S\n]*)?"
+    r"(?P<path>(?:[A-Za-z0-9._-]+/)+[A-Za-z0-9._-]+)[^\S\n]*$",
+    re.MULTILINE,
 )
 
 
 def extract_section_lines(body: str) -> Tuple[List[str], bool]:
     lines = body.splitlines()
-    for i, line in enumerate(lines):
-        m = HEADING_RE.match(line)
-        if not m:
-            continue
-        level = len(m.group(1))
-        start = i + 1
-        end = len(lines)
-        for j in range(start, len(lines)):
-            m2 = re.match(r"^(#{1,6})\s+", lines[j])
-            if not m2:
-                continue
-            if len(m2.group(1)) <= level:
-                end = j
-                break
-        return lines[start:end], True
-    return lines, False
+    # splitlines() already removed every line break, so "\n" offsets map
+    # back to line indexes.
+    text = "\n".join(lines)
+    m = HEADING_RE.search(text)
+    if not m:
+        return lines, False
+
+    start = text.count("\n", 0, m.end()) + 1
+    m_end = SECTION_END_RES[len(m.group(1))].search(text, m.end())
+    if not m_end:
+        return lines[start:], True
+    end = text.count("\n", m.end(), m_end.start()) + start - 1
+    return lines[start:end], True
 
 
 def extract_paths(repo_root: str, lines: Sequence[str]) -> List[str]:
     out: Set[str] = set()
-
-    for line in lines:
-        for raw in BACKTICK_RE.findall(line):
-            resolved = None
-            try:
-                resolved = resolve_ref_to_repo_path(repo_root, raw)
-            except ValueError:
-                resolved = None
-            if resolved is not None:
-                out.add(resolved)
-
-        if "`" in line:
+    # Issue bodies repeat the same spans (e.g. checklists); resolve each once.
+    seen_raw: Set[str] = set()
+
+    # splitlines() already removed every line break, so joining on "\n" keeps
+    # each line intact for the MULTILINE anchors.
+    for m in PATH_REF_RE.finditer("\n".join(lines)):
+        raw = m.group("code") or m.group("path")
+        if raw in seen_raw:
             continue
-
-        m = BULLET_PATH_RE.match(line)
-        if m:
-            resolved = None
-            try:
-                resolved = resolve_ref_to_repo_path(repo_root, m.group("path"))
-            except ValueError:
-                resolved = None
-            if resolved is not None:
-                out.add(resolved)
+        seen_raw.add(raw)
+        try:
+            out.add(resolve_ref_to_repo_path(repo_root, raw))
+        except ValueError:
+            pass
 
     return sorted(out)
 
@@ -182,6 +210,11 @@ def main() -> int:
     )
 
     parser.add_argument("--gh-repo", default="", help="OWNER/REPO for gh")
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Always call gh (default: reuse a body fetched in the last {GH_CACHE_TTL_SECONDS}s)",
+    )
     parser.add_argument(
         "--mode",
         choices=["section", "anywhere"],
@@ -209,17 +242,20 @@ def main() -> int:
 
     body = ""
     try:
-        if args.issue:
+        if args.issue and args.no_cache:
             body = gh_issue_body(args.issue, args.gh_repo)
+        elif args.issue:
+            body = cached_gh_issue_body(args.issue, args.gh_repo)
         elif args.issue_body_file:
             raw = read_text(args.issue_body_file)
             body = raw
             # Convenience: allow passing `gh issue view --json body` output.
             parsed = None
-            try:
-                parsed = json.loads(raw)
-            except json.JSONDecodeError:
-                parsed = None
+            if JSON_OBJECT_START_RE.match(raw):
+                try:
+                    parsed = json.loads(raw)
+                except json.JSONDecodeError:
+                    parsed = None
             if isinstance(parsed, dict) and isinstance(parsed.get("body"), str):
                 body = parsed["body"]
         elif args.issue_json_file:
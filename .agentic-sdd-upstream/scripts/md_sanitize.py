@@ -4,7 +4,7 @@ Markdown sanitization utilities for stripping code blocks and comments.
 """
 
 import re
-from typing import List
+from typing import Iterator, List
 
 # Regex patterns for fenced code blocks (``` or ~~~)
 _FENCE_OPEN_RE = re.compile(r"^[ \t]{0,3}((?:`{3,})|(?:~{3,}))")
@@ -13,52 +13,106 @@ _FENCE_CLOSE_RE = re.compile(r"^[ \t]{0,3}((?:`{3,})|(?:~{3,}))[ \t]*$")
 # Regex pattern for indented code blocks (tab or 4+ spaces)
 _INDENTED_CODE_RE = re.compile(r"^(?:\t| {4,})")
 
-# Regex pattern for HTML comment blocks
-_HTML_COMMENT_BLOCK_RE = re.compile(r"<!--.*?-->", re.DOTALL)
-
-
-def strip_fenced_code_blocks(text: str) -> str:
-    """Strip fenced code blocks (``` or ~~~) from markdown text."""
-    out_lines: List[str] = []
+# First characters a fence / indented code line can start with.  Lines
+# starting with anything else skip the regex match entirely.
+_FENCE_LEAD_CHARS = frozenset(" \t`~")
+_INDENT_LEAD_CHARS = frozenset(" \t")
+
+# Left-to-right scanner for inline code spans.  Escapes and unmatched
+# backtick runs are consumed as their own tokens; only group 1 (the opening
+# run, captured atomically via lookahead) marks a complete code span.
+_CODE_SPAN_SCAN_RE = re.compile(
+    r"(?:\\\\)*\\`"  # escaped backtick (odd backslash run)
+    r"|\\+"  # other backslash runs
+    r"|(?=(`+))\1.*?(?<!`)\1(?!`)"  # code span closed by an equal-length run
+    r"|`+",  # backtick run without a closer
+    re.DOTALL,
+)
+
+
+def _iter_unfenced_lines(text: str) -> Iterator[str]:
+    """Yield lines (with line endings) that are outside fenced code blocks."""
     in_fence = False
     fence_char = ""
     fence_len = 0
+    # Bound-method aliases keep the per-line lookups local.
+    fence_open = _FENCE_OPEN_RE.match
+    fence_close = _FENCE_CLOSE_RE.match
 
     for line in text.splitlines(keepends=True):
+        if line[0] not in _FENCE_LEAD_CHARS:
+            if not in_fence:
+                yield line
+            continue
         if not in_fence:
-            m_open = _FENCE_OPEN_RE.match(line)
+            m_open = fence_open(line)
             if m_open:
                 seq = m_open.group(1)
                 in_fence = True
                 fence_char = seq[0]
                 fence_len = len(seq)
                 continue
+            yield line
         else:
-            m_close = _FENCE_CLOSE_RE.match(line)
+            m_close = fence_close(line)
             if m_close:
                 seq = m_close.group(1)
                 if seq[0] == fence_char and len(seq) >= fence_len:
                     in_fence = False
                     fence_char = ""
                     fence_len = 0
-                    continue
 
-        if not in_fence:
-            out_lines.append(line)
 
-    return "".join(out_lines)
+def _has_fence_marker(text: str) -> bool:
+    return "```" in text or "~~~" in text
+
+
+def _has_indent_marker(text: str) -> bool:
+    return "\t" in text or "    " in text
+
+
+def strip_fenced_code_blocks(text: str) -> str:
+    """Strip fenced code blocks (``` or ~~~) from markdown text."""
+    if not _has_fence_marker(text):
+        return text
+    return "".join(_iter_unfenced_lines(text))
 
 
 def strip_indented_code_blocks(text: str) -> str:
     """Strip indented code blocks (tab or 4+ spaces) from markdown text."""
+    if not _has_indent_marker(text):
+        return text
     out_lines: List[str] = []
+    append = out_lines.append
+    indented_match = _INDENTED_CODE_RE.match
     for line in text.splitlines(keepends=True):
-        if _INDENTED_CODE_RE.match(line):
+        if line[0] in _INDENT_LEAD_CHARS and indented_match(line):
             continue
-        out_lines.append(line)
+        append(line)
     return "".join(out_lines)
 
 
+def strip_code_blocks(text: str) -> str:
+    """Strip fenced and indented code blocks in a single line pass.
+
+    Same result as ``strip_indented_code_blocks(strip_fenced_code_blocks(text))``
+    except where removing a fence leaves a line ending in a bare CR right
+    before a line starting with LF: the two-pass version re-splits the joined
+    text and sees one CRLF line there, while this pass keeps the original
+    line boundaries.
+    """
+    if not _has_fence_marker(text):
+        return strip_indented_code_blocks(text)
+    if not _has_indent_marker(text):
+        return strip_fenced_code_blocks(text)
+    indented_match = _INDENTED_CODE_RE.match
+    return "".join(
+        line
+        for line in _iter_unfenced_lines(text)
+        if line[0] not in _INDENT_LEAD_CHARS or not indented_match(line)
+    )
+
+
 def _mask_inline_code_spans(text: str) -> str:
     """Replace inline code spans with spaces, preserving string length.
 
@@ -67,44 +121,21 @@ def _mask_inline_code_spans(text: str) -> str:
     - Inside code spans, backslash is literal (no escaping).
     - Code spans are opened/closed by backtick strings of equal length.
     """
-    out = list(text)
-    i = 0
-    n = len(text)
-    while i < n:
-        # --- backslash sequences (outside code spans) ---
-        if text[i] == "\\":
-            bs_start = i
-            while i < n and text[i] == "\\":
-                i += 1
-            num_bs = i - bs_start
-            # Odd backslashes followed by backtick → last \` is escaped
-            if i < n and text[i] == "`" and num_bs % 2 == 1:
-                i += 1  # skip the escaped backtick
+    if "`" not in text:
+        return text
+    parts: List[str] = []
+    last_end = 0
+    for m in _CODE_SPAN_SCAN_RE.finditer(text):
+        if m.group(1) is None:
             continue
-        # --- potential code span opener ---
-        if text[i] == "`":
-            open_start = i
-            while i < n and text[i] == "`":
-                i += 1
-            open_len = i - open_start
-            # search for matching closer (no escaping inside code spans)
-            k = i
-            while k < n:
-                if text[k] == "`":
-                    cs = k
-                    while k < n and text[k] == "`":
-                        k += 1
-                    if k - cs == open_len:
-                        for p in range(open_start, k):
-                            out[p] = " "
-                        i = k
-                        break
-                else:
-                    k += 1
-            # if not found, i is already past the opening backticks
-        else:
-            i += 1
-    return "".join(out)
+        start, end = m.span()
+        parts.append(text[last_end:start])
+        parts.append(" " * (end - start))
+        last_end = end
+    if not parts:
+        return text
+    parts.append(text[last_end:])
+    return "".join(parts)
 
 
 def strip_html_comment_blocks(text: str) -> str:
@@ -118,19 +149,31 @@ def strip_html_comment_blocks(text: str) -> str:
     unmatched ``<!--`` (no closing ``-->`` and not inside inline code),
     everything from that opener onward is removed.
     """
+    if "<!--" not in text:
+        return text
     masked = _mask_inline_code_spans(text)
     # Find matched <!-- ... --> spans in the masked copy, then splice
     # the *original* text around those ranges to preserve inline code.
     parts: List[str] = []
     last_end = 0
-    for m in _HTML_COMMENT_BLOCK_RE.finditer(masked):
-        parts.append(text[last_end : m.start()])
-        last_end = m.end()
-    parts.append(text[last_end:])
-    result = "".join(parts)
-    # Check for a genuine unmatched <!-- (re-mask since character
-    # positions shifted after comment removal).
-    result_masked = _mask_inline_code_spans(result)
+    open_at = masked.find("<!--")
+    while open_at != -1:
+        close_at = masked.find("-->", open_at + 4)
+        if close_at == -1:
+            break
+        parts.append(text[last_end:open_at])
+        last_end = close_at + 3
+        open_at = masked.find("<!--", last_end)
+    if not parts:
+        # Nothing removed: the existing mask is still valid for the check.
+        result = text
+        result_masked = masked
+    else:
+        parts.append(text[last_end:])
+        result = "".join(parts)
+        # Re-mask since removing comments can change code span pairing.
+        result_masked = _mask_inline_code_spans(result)
+    # Check for a genuine unmatched <!--
     i = result_masked.find("<!--")
     if i == -1:
         return result
@@ -144,6 +187,4 @@ def sanitize_status_text(text: str) -> str:
     Markdown documents.  Centralised here to avoid duplicating the call
     chain in every consumer.
     """
-    return strip_html_comment_blocks(
-        strip_indented_code_blocks(strip_fenced_code_blocks(text))
-    )
+    return strip_html_comment_blocks(strip_code_blocks(text))
@@ -0,0 +1,110 @@
+"""Per-cwd cache for `git rev-parse --show-toplevel`.
+
+Gate hooks resolve the repo root on every tool call.  Caching the answer in a
+small index (keyed by the working directory) lets repeated calls skip the
+git fork/exec.  An entry is reused only while `<root>/.git` keeps the same
+mtime and no nearer `.git` has appeared between the cwd and the cached root.
+The index keeps only the MAX_ENTRIES most recently resolved directories.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from typing import Any, Callable, Dict, Optional
+
+# Environment variables that change how git locates the repository
+_GIT_LOCATION_ENV = ("GIT_DIR", "GIT_WORK_TREE", "GIT_CEILING_DIRECTORIES")
+
+# Working directories remembered in the index; older ones are dropped
+MAX_ENTRIES = 64
+
+
+def cache_path() -> str:
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(base, "agentic-sdd", "repo-root.json")
+
+
+def _load_index(path: str) -> Dict[str, Any]:
+    try:
+        with open(path, "rb") as fh:
+            index = json.loads(fh.read())
+    except (OSError, ValueError):
+        return {}
+    return index if isinstance(index, dict) else {}
+
+
+def _git_mtime_ns(root: str) -> Optional[int]:
+    try:
+        return os.stat(os.path.join(root, ".git")).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _is_nearest_repo_root(cwd: str, root: str) -> bool:
+    """True if root is an ancestor of cwd with no `.git` in between."""
+    cur = os.path.realpath(cwd)
+    while cur != root:
+        if os.path.lexists(os.path.join(cur, ".git")):
+            return False
+        parent = os.path.dirname(cur)
+        if parent == cur:
+            return False
+        cur = parent
+    return True
+
+
+def cached_repo_root(resolve: Callable[[], Optional[str]]) -> Optional[str]:
+    """Return the repo root for the cwd, calling resolve() only on a cache miss.
+
+    resolve() runs git and returns the real path of the root (or None); its
+    exceptions propagate unchanged.  Cache failures never fail the caller.
+    """
+    if any(os.environ.get(name) for name in _GIT_LOCATION_ENV):
+        return resolve()
+    try:
+        cwd = os.getcwd()
+    except OSError:
+        return resolve()
+
+    path = cache_path()
+    index = _load_index(path)
+
+    entry: Any = index.get(cwd)
+    try:
+        root = entry["root"]
+        if (
+            isinstance(root, str)
+            and entry["git_mtime_ns"] == _git_mtime_ns(root)
+            and _is_nearest_repo_root(cwd, root)
+        ):
+            return root
+    except (OSError, KeyError, TypeError):
+        pass
+
+    root = resolve()
+    if not root:
+        return root
+
+    mtime_ns = _git_mtime_ns(root)
+    if mtime_ns is None:
+        return root
+    # Re-insert so the dict order runs from least to most recently resolved.
+    index.pop(cwd, None)
+    index[cwd] = {"root": root, "git_mtime_ns": mtime_ns}
+    for stale in list(index)[:-MAX_ENTRIES]:
+        del index[stale]
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump(index, fh)
+        os.replace(tmp, path)
+    except OSError:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+    return root
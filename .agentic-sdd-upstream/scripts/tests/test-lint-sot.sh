@@ -16,6 +16,9 @@ tmpdir="$(mktemp -d 2>/dev/null || mktemp -d -t agentic-sdd-lint-sot-test)"
 cleanup() { rm -rf "$tmpdir"; }
 trap cleanup EXIT
 
+# Keep script caches (repo root, gh issues, validation stamps) out of ~/.cache
+export XDG_CACHE_HOME="$tmpdir/cache"
+
 new_repo() {
 	local name="$1"
 	local r="$tmpdir/$name"
@@ -24,6 +27,7 @@ new_repo() {
 	mkdir -p "$r/scripts" "$r/docs/prd" "$r/docs/sot" "$r/docs"
 	cp -p "$lint_py_src" "$r/scripts/lint-sot.py"
 	cp -p "$repo_root/scripts/md_sanitize.py" "$r/scripts/md_sanitize.py"
+	cp -p "$repo_root/scripts/repo_root_cache.py" "$r/scripts/repo_root_cache.py"
 	chmod +x "$r/scripts/lint-sot.py"
 	printf '%s\n' "$r"
 }
@@ -10,6 +10,9 @@ tmpdir="$(mktemp -d 2>/dev/null || mktemp -d -t agentic-sdd-ruff-gate)"
 cleanup() { rm -rf "$tmpdir"; }
 trap cleanup EXIT
 
+# Keep script caches (repo root, gh issues, validation stamps) out of ~/.cache
+export XDG_CACHE_HOME="$tmpdir/cache"
+
 work="$tmpdir/work"
 remote="$tmpdir/remote.git"
 venv="$tmpdir/venv"
@@ -16,6 +16,9 @@ tmpdir="$(mktemp -d 2>/dev/null || mktemp -d -t agentic-sdd-decision-test)"
 cleanup() { rm -rf "$tmpdir"; }
 trap cleanup EXIT
 
+# Keep script caches (repo root, gh issues, validation stamps) out of ~/.cache
+export XDG_CACHE_HOME="$tmpdir/cache"
+
 new_repo() {
 	local name="$1"
 	local r="$tmpdir/$name"
@@ -1,7 +1,6 @@
 #!/usr/bin/env python3
 
 import argparse
-import hashlib
 import json
 import os
 import re
@@ -10,10 +9,22 @@ import subprocess
 import sys
 from typing import Any, Dict, List, Optional, Tuple
 
-from approval_constants import MODE_ALLOWED, MODE_SOURCE_ALLOWED
+import approval_constants
+from approval_constants import (
+    MODE_ALLOWED,
+    MODE_SOURCE_ALLOWED,
+    sha256_normalized_file,
+)
 
 EXIT_GATE_BLOCKED = 2
 
+# Set to a non-empty value to always re-read and re-hash (e.g. in CI).
+NO_VALIDATE_CACHE_ENV = "AGENTIC_SDD_NO_VALIDATE_CACHE"
+
+_ISSUE_BRANCH_RE = re.compile(r"\bissue-(\d+)\b")
+_APPROVED_AT_RE = re.compile(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z$")
+_SHA256_PREFIXED_RE = re.compile(r"^sha256:[0-9a-f]{64}$")
+
 
 def eprint(msg: str) -> None:
     print(msg, file=sys.stderr)
@@ -54,7 +65,7 @@ def current_branch(repo_root: str) -> str:
 
 
 def extract_issue_number_from_branch(branch: str) -> Optional[int]:
-    m = re.search(r"\bissue-(\d+)\b", branch)
+    m = _ISSUE_BRANCH_RE.search(branch)
     if not m:
         return None
     try:
@@ -66,20 +77,6 @@ def extract_issue_number_from_branch(branch: str) -> Optional[int]:
     return n
 
 
-def normalize_text_for_hash(text: str) -> bytes:
-    # Normalize line endings for cross-platform determinism.
-    text = text.replace("\r\n", "\n").replace("\r", "\n")
-    if not text.endswith("\n"):
-        text += "\n"
-    return text.encode("utf-8")
-
-
-def sha256_prefixed(data: bytes) -> str:
-    h = hashlib.sha256()
-    h.update(data)
-    return f"sha256:{h.hexdigest()}"
-
-
 def read_utf8_text(path: str) -> str:
     with open(path, "r", encoding="utf-8") as fh:
         return fh.read()
@@ -101,6 +98,74 @@ def resolve_approval_script(repo_root: str, script_name: str) -> str:
     return os.path.join("scripts", script_name)
 
 
+def validated_cache_path() -> str:
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(base, "agentic-sdd", "approval-validated.json")
+
+
+def _load_stamps(cache_path: str) -> Dict[str, Any]:
+    try:
+        with open(cache_path, "rb") as fh:
+            stamps = json.loads(fh.read())
+    except (OSError, ValueError):
+        return {}
+    return stamps if isinstance(stamps, dict) else {}
+
+
+def _stat_signature(path: str) -> List[int]:
+    st = os.stat(path)
+    return [st.st_mtime_ns, st.st_ctime_ns, st.st_size, st.st_ino]
+
+
+def validation_stamp(
+    issue_number: int, approval_json: str, estimate_md: str
+) -> Optional[Dict[str, Any]]:
+    """Identify the inputs of a validation run by their stat signatures.
+
+    Covers approval.json, estimate.md and the rules (this script and
+    approval_constants.py).  Rewriting any of them changes its ctime, so a
+    matching stamp means the same records passed under the same rules.
+    """
+    try:
+        return {
+            "issue_number": issue_number,
+            "approval": _stat_signature(approval_json),
+            "estimate": _stat_signature(estimate_md),
+            "validator": _stat_signature(os.path.abspath(__file__)),
+            "constants": _stat_signature(os.path.abspath(approval_constants.__file__)),
+        }
+    except OSError:
+        return None
+
+
+def is_known_valid(cache_path: str, approval_json: str, stamp: Dict[str, Any]) -> bool:
+    key = os.path.realpath(approval_json)
+    return bool(_load_stamps(cache_path).get(key) == stamp)
+
+
+def record_valid(cache_path: str, approval_json: str, stamp: Dict[str, Any]) -> None:
+    """Store the stamp for approval_json, dropping stamps of deleted records."""
+    stamps = {
+        key: value
+        for key, value in _load_stamps(cache_path).items()
+        if os.path.isfile(key)
+    }
+    stamps[os.path.realpath(approval_json)] = stamp
+    tmp = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump(stamps, fh)
+        os.replace(tmp, cache_path)
+    except OSError:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+
+
 def load_approval_json(path: str) -> Dict[str, Any]:
     raw = read_utf8_text(path)
     obj = json.loads(raw)
@@ -126,7 +191,10 @@ def pick_estimate_hash_field(obj: Dict[str, Any]) -> Tuple[str, str]:
     return field, value
 
 
-def validate_approval(obj: Dict[str, Any], expected_issue_number: int) -> None:
+def validate_approval(
+    obj: Dict[str, Any], expected_issue_number: int
+) -> Tuple[str, str]:
+    """Validate an approval record; return its (estimate hash field, value)."""
     required = {
         "schema_version",
         "issue_number",
@@ -142,7 +210,7 @@ def validate_approval(obj: Dict[str, Any], expected_issue_number: int) -> None:
         raise KeyError(f"missing keys: {sorted(missing)}")
 
     # estimate_hash/estimate_sha256 is validated separately.
-    _field, _value = pick_estimate_hash_field(obj)
+    estimate_field = pick_estimate_hash_field(obj)
 
     extra_allowed = {"estimate_hash", "estimate_sha256"}
     extra = set(obj.keys()) - required - extra_allowed
@@ -178,7 +246,7 @@ def validate_approval(obj: Dict[str, Any], expected_issue_number: int) -> None:
     approved_at = obj.get("approved_at")
     if not isinstance(approved_at, str) or not approved_at:
         raise ValueError("approved_at must be a non-empty string")
-    if not re.match(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z$", approved_at):
+    if not _APPROVED_AT_RE.match(approved_at):
         raise ValueError(
             "approved_at must be ISO 8601 UTC timestamp like YYYY-MM-DDTHH:mm:ssZ"
         )
@@ -187,6 +255,8 @@ def validate_approval(obj: Dict[str, Any], expected_issue_number: int) -> None:
     if not isinstance(approver, str) or not approver:
         raise ValueError("approver must be a non-empty string")
 
+    return estimate_field
+
 
 def gate_blocked(msg: str, create_script: str, validate_script: str) -> int:
     eprint("[agentic-sdd gate] BLOCKED")
@@ -251,8 +321,16 @@ def main() -> int:
             validate_script,
         )
 
+    # Stamp before reading: a file changed mid-run makes the stamp stale.
+    stamp: Optional[Dict[str, Any]] = None
+    cache_path = validated_cache_path()
+    if not os.environ.get(NO_VALIDATE_CACHE_ENV):
+        stamp = validation_stamp(issue_number, approval_json, estimate_md)
+        if stamp is not None and is_known_valid(cache_path, approval_json, stamp):
+            return 0
+
     try:
-        estimate_text = read_utf8_text(estimate_md)
+        computed_hash = sha256_normalized_file(estimate_md)
     except Exception as exc:  # noqa: BLE001
         return gate_blocked(
             f"Failed to read estimate.md (utf-8 required): {exc}",
@@ -260,13 +338,12 @@ def main() -> int:
             validate_script,
         )
 
-    computed_hash = sha256_prefixed(normalize_text_for_hash(estimate_text))
-
     try:
         obj = load_approval_json(approval_json)
-        validate_approval(obj, expected_issue_number=issue_number)
-        field, recorded_hash = pick_estimate_hash_field(obj)
-        if not re.match(r"^sha256:[0-9a-f]{64}$", recorded_hash):
+        field, recorded_hash = validate_approval(
+            obj, expected_issue_number=issue_number
+        )
+        if not _SHA256_PREFIXED_RE.match(recorded_hash):
             raise ValueError(f"{field} must be 'sha256:<64 lowercase hex>'")
         if recorded_hash != computed_hash:
             mode_for_cmd = shlex.quote(str(obj.get("mode") or "<mode>"))
@@ -296,6 +373,8 @@ def main() -> int:
             f"Invalid approval.json: {exc}", create_script, validate_script
         )
 
+    if stamp is not None:
+        record_valid(cache_path, approval_json, stamp)
     return 0
 
 
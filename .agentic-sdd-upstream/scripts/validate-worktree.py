@@ -2,12 +2,15 @@
 
 import os
 import re
+import stat
 import subprocess
 import sys
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 EXIT_GATE_BLOCKED = 2
 
+_ISSUE_BRANCH_RE = re.compile(r"\bissue-(\d+)\b")
+
 
 def eprint(msg: str) -> None:
     print(msg, file=sys.stderr)
@@ -28,15 +31,22 @@ def run(
     )
 
 
-def git_repo_root() -> str:
-    try:
-        p = run(["git", "rev-parse", "--show-toplevel"], check=True)
-    except subprocess.CalledProcessError:
-        raise RuntimeError("Not in a git repository; cannot locate repo root.")
-    root = p.stdout.strip()
+def git_repo_root_and_branch() -> Tuple[str, str]:
+    # One git spawn for both values on the common (attached, born) HEAD path.
+    p = run(
+        ["git", "rev-parse", "--show-toplevel", "--abbrev-ref", "HEAD"], check=False
+    )
+    lines = p.stdout.splitlines()
+    root = lines[0].strip() if lines else ""
     if not root:
-        raise RuntimeError("Failed to locate repo root via git.")
-    return os.path.realpath(root)
+        raise RuntimeError("Not in a git repository; cannot locate repo root.")
+    root = os.path.realpath(root)
+
+    branch = lines[1].strip() if p.returncode == 0 and len(lines) > 1 else "HEAD"
+    if branch == "HEAD":
+        # Detached or unborn HEAD: `git branch --show-current` names unborn branches.
+        branch = current_branch(root)
+    return root, branch
 
 
 def current_branch(repo_root: str) -> str:
@@ -48,16 +58,9 @@ def current_branch(repo_root: str) -> str:
 
 
 def extract_issue_number_from_branch(branch: str) -> Optional[int]:
-    m = re.search(r"\bissue-(\d+)\b", branch)
-    if not m:
-        return None
-    try:
-        n = int(m.group(1))
-    except ValueError:
-        return None
-    if n < 0:
-        return None
-    return n
+    # \d+ always parses and is never negative
+    m = _ISSUE_BRANCH_RE.search(branch)
+    return int(m.group(1)) if m else None
 
 
 def gate_blocked(msg: str) -> int:
@@ -74,18 +77,23 @@ def is_linked_worktree_gitfile(content: str) -> bool:
 
 def main() -> int:
     try:
-        repo_root = git_repo_root()
+        repo_root, branch = git_repo_root_and_branch()
     except Exception:
         return 0
 
-    branch = current_branch(repo_root)
     issue_number = extract_issue_number_from_branch(branch)
 
     if issue_number is None:
         return 0
 
     git_path = os.path.join(repo_root, ".git")
-    if os.path.isfile(git_path):
+    # One stat for both checks; follows symlinks like os.path.isfile/isdir did.
+    try:
+        git_mode = os.stat(git_path).st_mode
+    except (OSError, ValueError):
+        git_mode = 0
+
+    if stat.S_ISREG(git_mode):
         try:
             with open(git_path, "r", encoding="utf-8") as fh:
                 content = fh.read()
@@ -101,7 +109,7 @@ def main() -> int:
             f"- path: {git_path}"
         )
 
-    if os.path.isdir(git_path):
+    if stat.S_ISDIR(git_mode):
         return gate_blocked(
             "Worktree is required for Issue branches.\n"
             f"- branch: {branch}\n"
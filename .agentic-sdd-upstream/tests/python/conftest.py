@@ -1,13 +1,17 @@
 """Pytest configuration for Python tests.
 
 Adds the scripts directory to sys.path so that modules like md_sanitize
-can be imported when loading script modules via importlib.
+can be imported when loading script modules via importlib, and provides
+load_script_module for the hyphenated scripts that cannot be imported.
 """
 
 from __future__ import annotations
 
+import functools
+import importlib.util
 import sys
 from pathlib import Path
+from types import ModuleType
 
 _REPO_ROOT = Path(__file__).resolve().parents[2]
 _SCRIPTS_DIR = str(_REPO_ROOT / "scripts")
@@ -17,3 +21,20 @@ def pytest_configure() -> None:
     """Add scripts directory to sys.path once for all tests."""
     if _SCRIPTS_DIR not in sys.path:
         sys.path.insert(0, _SCRIPTS_DIR)
+
+
+@functools.lru_cache(maxsize=None)
+def load_script_module(module_name: str, script_name: str) -> ModuleType:
+    """Load scripts/<script_name> as module_name, once per test session."""
+    module_path = _REPO_ROOT / "scripts" / script_name
+    spec = importlib.util.spec_from_file_location(module_name, module_path)
+    if spec is None or spec.loader is None:
+        raise RuntimeError(f"Failed to load module spec: {module_path}")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        sys.modules.pop(module_name, None)
+        raise
+    return module
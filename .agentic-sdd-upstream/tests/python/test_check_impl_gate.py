@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from conftest import _SCRIPTS_DIR, load_script_module
+
+MODULE = load_script_module("check_impl_gate", "check-impl-gate.py")
+
+WORKTREE_GATE = str(Path(_SCRIPTS_DIR) / "validate-worktree.py")
+
+
+def _git_repo(path: Path, branch: str) -> Path:
+    subprocess.run(  # noqa: S603
+        ["git", "init", "-q", "-b", branch, str(path)],  # noqa: S607
+        check=True,
+    )
+    return path
+
+
+def test_run_gate_script_worktree_gate_passes_off_issue_branch(
+    tmp_path: Path,
+) -> None:
+    root = _git_repo(tmp_path / "repo", "main")
+    assert MODULE.run_gate_script(WORKTREE_GATE, str(root)) == 0
+
+
+def test_run_gate_script_worktree_gate_blocks_issue_branch(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    root = _git_repo(tmp_path / "repo", "feature/issue-7-demo")
+    assert MODULE.run_gate_script(WORKTREE_GATE, str(root)) == 2
+    assert "[agentic-sdd gate] BLOCKED" in capsys.readouterr().err
+    assert "_agentic_sdd_gate_validate_worktree" not in sys.modules
+
+
+def test_run_gate_script_dataclass_gate(tmp_path: Path) -> None:
+    script = tmp_path / "gate.py"
+    script.write_text(
+        "from __future__ import annotations\n"
+        "from dataclasses import dataclass\n"
+        "\n"
+        "@dataclass\n"
+        "class Result:\n"
+        "    code: int\n"
+        "\n"
+        "def main() -> int:\n"
+        "    return Result(3).code\n",
+        encoding="utf-8",
+    )
+    assert MODULE.run_gate_script(str(script), str(tmp_path)) == 3
+
+
+def test_run_gate_script_error_prints_traceback(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    script = tmp_path / "gate.py"
+    script.write_text("def main() -> int:\n    raise ValueError('boom')\n")
+    assert MODULE.run_gate_script(str(script), str(tmp_path)) == 1
+    err = capsys.readouterr().err
+    assert "Traceback" in err
+    assert "ValueError: boom" in err
+
+
+def test_run_gate_script_without_main_uses_subprocess(tmp_path: Path) -> None:
+    script = tmp_path / "gate.py"
+    script.write_text("raise SystemExit(4)\n", encoding="utf-8")
+    assert MODULE.run_gate_script(str(script), str(tmp_path)) == 4
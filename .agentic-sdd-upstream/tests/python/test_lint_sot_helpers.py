@@ -1,23 +1,9 @@
 from __future__ import annotations
 
-import importlib.util
-from pathlib import Path
-from types import ModuleType
+from conftest import load_script_module
 
-
-def _load_script_module(module_name: str, script_name: str) -> ModuleType:
-    repo_root = Path(__file__).resolve().parents[2]
-    module_path = repo_root / "scripts" / script_name
-    spec = importlib.util.spec_from_file_location(module_name, module_path)
-    if spec is None or spec.loader is None:
-        raise RuntimeError(f"Failed to load module spec: {module_path}")
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
-    return module
-
-
-MODULE = _load_script_module("lint_sot", "lint-sot.py")
-EXTRACT_EPIC_CONFIG_MODULE = _load_script_module(
+MODULE = load_script_module("lint_sot", "lint-sot.py")
+EXTRACT_EPIC_CONFIG_MODULE = load_script_module(
     "extract_epic_config", "extract-epic-config.py"
 )
 
@@ -72,6 +58,24 @@ def test_has_candidate_evidence_url() -> None:
     assert not MODULE.has_candidate_evidence_url(block_ng)
 
 
+def test_extract_candidate_blocks() -> None:
+    text = "候補-1\n概要: a\n候補-2\n概要: b\n## next\n候補-3\n---\ntail\n"
+    assert MODULE.extract_candidate_blocks(text) == [
+        ("1", "候補-1\n概要: a\n"),
+        ("2", "候補-2\n概要: b\n"),
+        ("3", "候補-3\n"),
+    ]
+    assert MODULE.extract_candidate_blocks("no candidates") == []
+
+
+def test_strip_inline_code_spans() -> None:
+    assert MODULE.strip_inline_code_spans("a `x` b ``y ` z`` c") == "a  b  c"
+    # A run without a matching closer is kept and scanning resumes after it.
+    assert MODULE.strip_inline_code_spans("``open ` x`") == "``open "
+    # The closer is the next copy of the run, even inside a longer run.
+    assert MODULE.strip_inline_code_spans("``a```b") == "`b"
+
+
 def test_extract_meta_info_ignores_status_in_fenced_code_and_html_comment() -> None:
     text = """
 # Epic: Test
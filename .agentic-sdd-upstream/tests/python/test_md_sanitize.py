@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import md_sanitize
+
+
+def test_mask_inline_code_spans_preserves_length() -> None:
+    text = "a `code` b ``x ` y`` c"
+    masked = md_sanitize._mask_inline_code_spans(text)
+    assert len(masked) == len(text)
+    assert masked == "a " + " " * 6 + " b " + " " * 9 + " c"
+
+
+def test_mask_inline_code_spans_escaped_backtick_is_not_opener() -> None:
+    text = "\\`not code and `code`"
+    masked = md_sanitize._mask_inline_code_spans(text)
+    assert masked == "\\`not code and " + " " * 6
+
+
+def test_mask_inline_code_spans_backslash_is_literal_inside_span() -> None:
+    text = "`\\`<!--"
+    masked = md_sanitize._mask_inline_code_spans(text)
+    assert masked == "   <!--"
+
+
+def test_mask_inline_code_spans_unmatched_opener_is_kept() -> None:
+    text = "``open ` only"
+    assert md_sanitize._mask_inline_code_spans(text) == text
+
+
+def test_strip_html_comment_blocks_removes_matched_comments() -> None:
+    text = "a<!-- x -->b<!--\ny\n-->c"
+    assert md_sanitize.strip_html_comment_blocks(text) == "abc"
+
+
+def test_strip_html_comment_blocks_keeps_delimiters_inside_code_spans() -> None:
+    text = "keep `<!--` and `-->` here"
+    assert md_sanitize.strip_html_comment_blocks(text) == text
+
+
+def test_strip_html_comment_blocks_truncates_at_unmatched_opener() -> None:
+    text = "head <!-- x --> mid <!-- open\ntail"
+    assert md_sanitize.strip_html_comment_blocks(text) == "head  mid "
+
+
+def test_strip_code_blocks_matches_two_pass_strip() -> None:
+    text = "intro\n    code\n```\nfenced\n```\n\ttab code\noutro\n"
+    expected = md_sanitize.strip_indented_code_blocks(
+        md_sanitize.strip_fenced_code_blocks(text)
+    )
+    assert md_sanitize.strip_code_blocks(text) == expected == "intro\noutro\n"
+
+
+def test_strip_code_blocks_keeps_line_boundaries_around_bare_cr() -> None:
+    # The fence removal joins "\t\r" and "\n"; only the two-pass version
+    # re-splits them into a single CRLF line.
+    text = "\t\r```\n```\n\n"
+    assert md_sanitize.strip_code_blocks(text) == "\n"
+    assert (
+        md_sanitize.strip_indented_code_blocks(
+            md_sanitize.strip_fenced_code_blocks(text)
+        )
+        == ""
+    )
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+import repo_root_cache
+
+
+@pytest.fixture
+def repo(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    root = tmp_path / "repo"
+    (root / ".git").mkdir(parents=True)
+    (root / "sub").mkdir()
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    for name in ("GIT_DIR", "GIT_WORK_TREE", "GIT_CEILING_DIRECTORIES"):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.chdir(root / "sub")
+    return Path(os.path.realpath(root))
+
+
+def test_cached_repo_root_skips_resolver_on_hit(repo: Path) -> None:
+    calls: list[int] = []
+
+    def resolve() -> str:
+        calls.append(1)
+        return str(repo)
+
+    assert repo_root_cache.cached_repo_root(resolve) == str(repo)
+    assert repo_root_cache.cached_repo_root(resolve) == str(repo)
+    assert len(calls) == 1
+
+
+def test_cached_repo_root_misses_when_nearer_git_appears(repo: Path) -> None:
+    assert repo_root_cache.cached_repo_root(lambda: str(repo)) == str(repo)
+
+    (repo / "sub" / ".git").mkdir()
+    nested = str(repo / "sub")
+    assert repo_root_cache.cached_repo_root(lambda: nested) == nested
+
+
+def test_cached_repo_root_does_not_cache_failures(repo: Path) -> None:
+    assert repo_root_cache.cached_repo_root(lambda: None) is None
+    assert repo_root_cache.cached_repo_root(lambda: str(repo)) == str(repo)
+
+
+def test_cached_repo_root_keeps_most_recent_cwds(
+    repo: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(repo_root_cache, "MAX_ENTRIES", 2)
+    for name in ("a", "b", "c"):
+        (repo / name).mkdir()
+        monkeypatch.chdir(repo / name)
+        repo_root_cache.cached_repo_root(lambda: str(repo))
+
+    index = json.loads(Path(repo_root_cache.cache_path()).read_text())
+    assert list(index) == [str(repo / "b"), str(repo / "c")]
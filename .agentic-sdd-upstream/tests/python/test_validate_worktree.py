@@ -1,22 +1,8 @@
 from __future__ import annotations
 
-import importlib.util
-from pathlib import Path
-from types import ModuleType
+from conftest import load_script_module
 
-
-def load_module() -> ModuleType:
-    repo_root = Path(__file__).resolve().parents[2]
-    module_path = repo_root / "scripts" / "validate-worktree.py"
-    spec = importlib.util.spec_from_file_location("validate_worktree", module_path)
-    if spec is None or spec.loader is None:
-        raise RuntimeError(f"Failed to load module spec: {module_path}")
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
-    return module
-
-
-MODULE = load_module()
+MODULE = load_script_module("validate_worktree", "validate-worktree.py")
 
 
 def test_extract_issue_number_from_branch() -> None:
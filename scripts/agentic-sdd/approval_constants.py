@@ -1,2 +1,43 @@
+import codecs
+import hashlib
+
 MODE_ALLOWED = {"impl", "tdd", "custom"}
 MODE_SOURCE_ALLOWED = {"agent-heuristic", "user-choice", "operator-override"}
+
+HASH_CHUNK_BYTES = 64 * 1024
+
+
+def sha256_normalized_file(path: str) -> str:
+    """Hash a UTF-8 file with CRLF/CR normalised to LF and a trailing LF.
+
+    create-approval.py records this hash and validate-approval.py recomputes
+    it, so both must use this one implementation.
+
+    The file is streamed in fixed-size chunks, so memory use does not grow
+    with its size.  Newlines are handled on raw bytes (CR never occurs inside
+    a multi-byte UTF-8 sequence); a CR at a chunk end is held back in case
+    the next chunk starts with LF.  Raises UnicodeDecodeError for non-UTF-8.
+    """
+    h = hashlib.sha256()
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    pending_cr = False
+    last = b""
+    with open(path, "rb") as fh:
+        while chunk := fh.read(HASH_CHUNK_BYTES):
+            decoder.decode(chunk)  # validate only
+            if pending_cr:
+                chunk = b"\r" + chunk
+            pending_cr = chunk.endswith(b"\r")
+            if pending_cr:
+                chunk = chunk[:-1]
+            chunk = chunk.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+            if chunk:
+                h.update(chunk)
+                last = chunk[-1:]
+    decoder.decode(b"", final=True)
+    if pending_cr:
+        h.update(b"\n")
+        last = b"\n"
+    if last != b"\n":
+        h.update(b"\n")
+    return f"sha256:{h.hexdigest()}"
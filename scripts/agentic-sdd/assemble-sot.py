@@ -1,22 +1,59 @@
 #!/usr/bin/env python3
 
 import argparse
+import functools
 import json
 import os
 import re
+import stat
 import sys
-from typing import Dict, List, Optional, Tuple
+from pathlib import Path
+from typing import Dict, List, Optional
 
 from sot_refs import find_issue_ref, resolve_ref_to_repo_path
 
+_H2_LINE_RE = re.compile(r"^## [^\n]*", re.MULTILINE)
+_NUMBERED_H2_RE = re.compile(r"^##\s+[1-8]\.")
+
+_STDOUT_CHUNK_CHARS = 64 * 1024
+
 
 def eprint(msg: str) -> None:
     print(msg, file=sys.stderr)
 
 
+def write_stdout(text: str) -> None:
+    # Encode in bounded slices straight to the binary buffer so a large
+    # bundle is never duplicated as one full-size bytes object.
+    buf = sys.stdout.buffer
+    for start in range(0, len(text), _STDOUT_CHUNK_CHARS):
+        buf.write(text[start : start + _STDOUT_CHUNK_CHARS].encode("utf-8"))
+    buf.flush()
+
+
 def read_text(path: str) -> str:
-    with open(path, "r", encoding="utf-8") as fh:
-        return fh.read()
+    text = Path(path).read_bytes().decode("utf-8")
+    # Match text-mode universal newlines without going through TextIOWrapper.
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+@functools.lru_cache(maxsize=128)
+def _read_text_cached(path: str, mtime_ns: int, size: int) -> str:
+    return read_text(path)
+
+
+def read_text_cached(path: str) -> str:
+    # One stat both rejects non-regular files and keys the cache.  Like
+    # os.path.isfile, any stat failure counts as "not a file".
+    try:
+        st = os.stat(path)
+    except (OSError, ValueError):
+        raise FileNotFoundError(path) from None
+    if not stat.S_ISREG(st.st_mode):
+        raise FileNotFoundError(path)
+    return _read_text_cached(path, st.st_mtime_ns, st.st_size)
 
 
 def truncate_keep_tail(text: str, max_chars: int, tail_chars: int = 2048) -> str:
@@ -31,91 +68,64 @@ def truncate_keep_tail(text: str, max_chars: int, tail_chars: int = 2048) -> str
         return out
 
     budget = max_chars - len(marker)
-    tail_len = min(tail_chars, budget)
+    tail_len = max(0, min(tail_chars, budget))
     head_len = budget - tail_len
-
-    head = text[:head_len]
-    tail = text[-tail_len:] if tail_len > 0 else ""
+    text_len = len(text)
 
     # Prefer cutting on line boundaries to reduce partial lines.
-    head_nl = head.rfind("\n")
+    head_end = head_len
+    head_nl = text.rfind("\n", 0, head_len)
     if head_nl > 0:
-        head = head[: head_nl + 1]
+        head_end = head_nl + 1
 
-    if tail:
-        tail_start = len(text) - tail_len
+    tail_start = text_len
+    if tail_len > 0:
+        tail_start = text_len - tail_len
         tail_nl = text.find("\n", tail_start)
-        if tail_nl != -1 and tail_nl + 1 < len(text):
-            tail = text[tail_nl + 1 :]
-
-    out = head + marker + tail
+        if tail_nl != -1 and tail_nl + 1 < text_len:
+            tail_start = tail_nl + 1
 
-    if not out.endswith("\n"):
-        if len(out) < max_chars:
-            out += "\n"
-        elif max_chars > 0:
-            out = out[:-1] + "\n"
+    # The marker ends with a newline, so only a non-empty tail can leave the
+    # output without one.  Append it when there is room, otherwise replace
+    # the last tail character.
+    tail_end = text_len
+    suffix = ""
+    if tail_start < text_len and not text.endswith("\n"):
+        suffix = "\n"
+        if head_end + len(marker) + (text_len - tail_start) >= max_chars:
+            tail_end -= 1
 
-    if len(out) > max_chars:
-        out = out[:max_chars]
-        if max_chars > 0 and not out.endswith("\n"):
-            out = out[:-1] + "\n"
-
-    return out
-
-
-def split_level2_sections(text: str) -> Tuple[str, List[Tuple[str, str]]]:
-    lines = text.splitlines(keepends=True)
-    pre: List[str] = []
-    sections: List[Tuple[str, str]] = []
-
-    current_title: Optional[str] = None
-    current_body: List[str] = []
-
-    def flush() -> None:
-        nonlocal current_title, current_body
-        if current_title is None:
-            return
-        sections.append((current_title, "".join(current_body)))
-        current_title = None
-        current_body = []
-
-    for line in lines:
-        if line.startswith("## "):
-            flush()
-            current_title = line.rstrip("\n")
-            current_body = [line]
-            continue
-        if current_title is None:
-            pre.append(line)
-        else:
-            current_body.append(line)
-
-    flush()
-    return "".join(pre), sections
+    return "".join((text[:head_end], marker, text[tail_start:tail_end], suffix))
 
 
+@functools.lru_cache(maxsize=128)
 def extract_wide_markdown(text: str) -> str:
-    pre, sections = split_level2_sections(text)
+    if not text.startswith("## ") and "\n## " not in text:
+        return text.rstrip() + "\n"
+
+    headings = [(m.start(), m.group()) for m in _H2_LINE_RE.finditer(text)]
     out: List[str] = []
 
+    pre = text[: headings[0][0]]
     if pre.strip():
-        out.append(pre.rstrip() + "\n\n")
+        out.append(pre.rstrip())
+        out.append("\n\n")
 
-    for i, (title, body) in enumerate(sections):
+    last = len(headings) - 1
+    for i, (start, title) in enumerate(headings):
         # Include first section (usually metadata) + numbered sections 1-8.
-        if i == 0:
-            out.append(body.rstrip() + "\n\n")
-            continue
-        if re.match(r"^##\s+[1-8]\.", title):
-            out.append(body.rstrip() + "\n\n")
+        # Only kept sections are sliced out of the text.
+        if i == 0 or _NUMBERED_H2_RE.match(title):
+            end = headings[i + 1][0] if i < last else len(text)
+            out.append(text[start:end].rstrip())
+            out.append("\n\n")
 
     return "".join(out).rstrip() + "\n"
 
 
 def read_issue_json(path: str) -> Dict[str, str]:
-    raw = read_text(path)
-    data = json.loads(raw)
+    # json.loads detects UTF-8 bytes itself, so skip the text decode step.
+    data = json.loads(Path(path).read_bytes())
     if not isinstance(data, dict):
         raise ValueError("issue json must be an object")
     title = str(data.get("title") or "")
@@ -138,13 +148,13 @@ def build_sot(
     if issue is not None:
         blocks.append("== Issue ==\n")
         if issue.get("number"):
-            blocks.append(f"Number: {issue['number']}\n")
+            blocks.extend(("Number: ", issue["number"], "\n"))
         if issue.get("url"):
-            blocks.append(f"URL: {issue['url']}\n")
+            blocks.extend(("URL: ", issue["url"], "\n"))
         if issue.get("title"):
-            blocks.append(f"Title: {issue['title']}\n")
+            blocks.extend(("Title: ", issue["title"], "\n"))
         blocks.append("\n")
-        blocks.append(issue.get("body", "").rstrip() + "\n\n")
+        blocks.extend((issue.get("body", "").rstrip(), "\n\n"))
 
         prd_ref = find_issue_ref(issue.get("body", ""), "PRD")
         epic_ref = find_issue_ref(issue.get("body", ""), "Epic")
@@ -159,14 +169,15 @@ def build_sot(
 
             prd_path = resolve_ref_to_repo_path(repo_root, prd_ref)
             abs_prd = os.path.join(repo_root, prd_path)
-            if not os.path.isfile(abs_prd):
+            try:
+                prd_text = read_text_cached(abs_prd)
+            except FileNotFoundError:
                 raise FileNotFoundError(
                     f"PRD file not found: {prd_path} (from: {prd_ref})"
-                )
-            prd_text = read_text(abs_prd)
+                ) from None
             blocks.append("== PRD (wide excerpt) ==\n")
-            blocks.append(f"Path: {prd_path}\n\n")
-            blocks.append(extract_wide_markdown(prd_text) + "\n")
+            blocks.extend(("Path: ", prd_path, "\n\n"))
+            blocks.extend((extract_wide_markdown(prd_text), "\n"))
 
         if epic_ref is not None:
             epic_ref = epic_ref.strip()
@@ -177,28 +188,34 @@ def build_sot(
 
             epic_path = resolve_ref_to_repo_path(repo_root, epic_ref)
             abs_epic = os.path.join(repo_root, epic_path)
-            if not os.path.isfile(abs_epic):
+            try:
+                epic_text = read_text_cached(abs_epic)
+            except FileNotFoundError:
                 raise FileNotFoundError(
                     f"Epic file not found: {epic_path} (from: {epic_ref})"
-                )
-            epic_text = read_text(abs_epic)
+                ) from None
             blocks.append("== Epic (wide excerpt) ==\n")
-            blocks.append(f"Path: {epic_path}\n\n")
-            blocks.append(extract_wide_markdown(epic_text) + "\n")
+            blocks.extend(("Path: ", epic_path, "\n\n"))
+            blocks.extend((extract_wide_markdown(epic_text), "\n"))
 
     for rel in extra_files:
         abs_path = os.path.join(repo_root, rel)
-        if not os.path.isfile(abs_path):
-            raise FileNotFoundError(f"SoT file not found: {rel}")
+        try:
+            extra_text = read_text_cached(abs_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"SoT file not found: {rel}") from None
         blocks.append("== Extra SoT File ==\n")
-        blocks.append(f"Path: {rel}\n\n")
-        blocks.append(read_text(abs_path).rstrip() + "\n\n")
+        blocks.extend(("Path: ", rel, "\n\n"))
+        blocks.extend((extra_text.rstrip(), "\n\n"))
 
     if manual_sot.strip():
         blocks.append("== Manual SoT ==\n")
-        blocks.append(manual_sot.rstrip() + "\n")
+        blocks.extend((manual_sot.rstrip(), "\n"))
 
-    out = "".join(blocks).rstrip() + "\n"
+    out = "".join(blocks)
+    # Skip the rstrip copy when the bundle already ends with a single newline.
+    if len(out) < 2 or out[-1] != "\n" or out[-2].isspace():
+        out = out.rstrip() + "\n"
     return truncate_keep_tail(out, max_chars=max_chars, tail_chars=2048)
 
 
@@ -255,7 +272,7 @@ def main() -> int:
         eprint(str(exc))
         return 2
 
-    sys.stdout.write(out)
+    write_stdout(out)
     return 0
 
 
@@ -2,10 +2,14 @@
 
 import json
 import os
+import re
 import subprocess
 import sys
 from typing import List, Optional
 
+_GIT_GATE_RE = re.compile(r"\bgit\s+(?:commit|push)\b")
+GATE_SCRIPTS = ("validate-worktree.py", "validate-approval.py")
+
 
 def eprint(msg: str) -> None:
     print(msg, file=sys.stderr)
@@ -26,6 +30,13 @@ def run(
     )
 
 
+def run_passthrough(cmd: List[str], cwd: str) -> int:
+    # Child output goes straight to our stdout/stderr; nothing to parse here.
+    sys.stdout.flush()
+    sys.stderr.flush()
+    return subprocess.run(cmd, cwd=cwd, check=False).returncode  # noqa: S603
+
+
 def repo_root() -> Optional[str]:
     try:
         p = run(["git", "rev-parse", "--show-toplevel"], check=False)
@@ -39,8 +50,7 @@ def repo_root() -> Optional[str]:
 
 def should_check_command(command: str) -> bool:
     """Check if the command is a git commit or git push command."""
-    keywords = ["git commit", "git push"]
-    return any(keyword in command for keyword in keywords)
+    return _GIT_GATE_RE.search(command) is not None
 
 
 def main() -> int:
@@ -61,35 +71,20 @@ def main() -> int:
     if not root:
         return 0
 
-    worktree_gate = os.path.join(root, "scripts", "validate-worktree.py")
-    if os.path.isfile(worktree_gate):
+    # Gates run in order; the first non-zero exit blocks the command.
+    scripts_dir = os.path.join(root, "scripts")
+    for name in GATE_SCRIPTS:
+        script = os.path.join(scripts_dir, name)
+        if not os.path.isfile(script):
+            continue
         try:
-            p = run([sys.executable, worktree_gate], cwd=root, check=False)
+            rc = run_passthrough([sys.executable, script], cwd=root)
         except Exception as exc:  # noqa: BLE001
             eprint(f"[agentic-sdd gate] error: {exc}")
             return 1
-        if p.stdout:
-            sys.stdout.write(p.stdout)
-        if p.stderr:
-            sys.stderr.write(p.stderr)
-        if p.returncode != 0:
-            return p.returncode
-
-    script = os.path.join(root, "scripts", "validate-approval.py")
-    if not os.path.isfile(script):
-        return 0
-
-    try:
-        p = run([sys.executable, script], cwd=root, check=False)
-    except Exception as exc:  # noqa: BLE001
-        eprint(f"[agentic-sdd gate] error: {exc}")
-        return 1
-
-    if p.stdout:
-        sys.stdout.write(p.stdout)
-    if p.stderr:
-        sys.stderr.write(p.stderr)
-    return p.returncode
+        if rc != 0:
+            return rc
+    return 0
 
 
 if __name__ == "__main__":
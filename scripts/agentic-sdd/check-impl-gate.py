@@ -1,11 +1,19 @@
 #!/usr/bin/env python3
 
+import importlib.util
 import json
 import os
+import re
 import subprocess
 import sys
+import traceback
 from typing import Any, Dict, List, Optional
 
+from repo_root_cache import cached_repo_root
+
+# Gate scripts with this entry point are run in-process (see run_gate_script)
+_MAIN_DEF_RE = re.compile(r"^def main\(", re.MULTILINE)
+
 
 def eprint(msg: str) -> None:
     print(msg, file=sys.stderr)
@@ -26,7 +34,7 @@ def run(
     )
 
 
-def repo_root() -> Optional[str]:
+def _git_toplevel() -> Optional[str]:
     try:
         p = run(["git", "rev-parse", "--show-toplevel"], check=False)
     except Exception:
@@ -37,6 +45,10 @@ def repo_root() -> Optional[str]:
     return os.path.realpath(root)
 
 
+def repo_root() -> Optional[str]:
+    return cached_repo_root(_git_toplevel)
+
+
 def read_stdin_json() -> Dict[str, Any]:
     raw = sys.stdin.read()
     if not raw.strip():
@@ -77,6 +89,62 @@ def is_agentic_sdd_local_path(path: str) -> bool:
     return False
 
 
+def run_gate_script_subprocess(script: str, root: str) -> int:
+    p = run([sys.executable, script], cwd=root, check=False)
+    if p.stdout:
+        sys.stdout.write(p.stdout)
+    if p.stderr:
+        sys.stderr.write(p.stderr)
+    return p.returncode
+
+
+def run_gate_script(script: str, root: str) -> int:
+    """Run a gate script's main() in this interpreter, as if `python script` in root.
+
+    Saves a Python startup per gate on every edit hook.  Scripts without a
+    top-level main() still run in a child interpreter.
+    """
+    with open(script, "r", encoding="utf-8") as fh:
+        if not _MAIN_DEF_RE.search(fh.read()):
+            return run_gate_script_subprocess(script, root)
+
+    name = "_agentic_sdd_gate_" + os.path.basename(script)[:-3].replace("-", "_")
+    spec = importlib.util.spec_from_file_location(name, script)
+    if spec is None or spec.loader is None:
+        raise RuntimeError(f"cannot load gate script: {script}")
+
+    saved_cwd, saved_argv, saved_path = os.getcwd(), sys.argv, list(sys.path)
+    try:
+        os.chdir(root)
+        sys.argv = [script]
+        sys.path.insert(0, os.path.dirname(script))
+        module = importlib.util.module_from_spec(spec)
+        # dataclasses and typing resolve annotations through sys.modules.
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+        code = module.main()
+    except SystemExit as exc:
+        code = exc.code
+    except Exception:  # noqa: BLE001
+        # Same output and exit code as an uncaught error under `python script`.
+        traceback.print_exc()
+        code = 1
+    finally:
+        sys.modules.pop(name, None)
+        os.chdir(saved_cwd)
+        sys.argv = saved_argv
+        sys.path[:] = saved_path
+        sys.stdout.flush()
+        sys.stderr.flush()
+
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    eprint(str(code))
+    return 1
+
+
 def main() -> int:
     obj = read_stdin_json()
     path = extract_path(obj)
@@ -88,16 +156,12 @@ def main() -> int:
     worktree_gate = os.path.join(root, "scripts", "validate-worktree.py")
     if os.path.isfile(worktree_gate):
         try:
-            p = run([sys.executable, worktree_gate], cwd=root, check=False)
+            rc = run_gate_script(worktree_gate, root)
         except Exception as exc:  # noqa: BLE001
             eprint(f"[agentic-sdd gate] error: {exc}")
             return 1
-        if p.stdout:
-            sys.stdout.write(p.stdout)
-        if p.stderr:
-            sys.stderr.write(p.stderr)
-        if p.returncode != 0:
-            return p.returncode
+        if rc != 0:
+            return rc
 
     if path and is_agentic_sdd_local_path(path):
         # Allow writing Agentic-SDD local artifacts (approvals/reviews), but still enforce worktree.
@@ -108,17 +172,11 @@ def main() -> int:
         return 0
 
     try:
-        p = run([sys.executable, script], cwd=root, check=False)
+        return run_gate_script(script, root)
     except Exception as exc:  # noqa: BLE001
         eprint(f"[agentic-sdd gate] error: {exc}")
         return 1
 
-    if p.stdout:
-        sys.stdout.write(p.stdout)
-    if p.stderr:
-        sys.stderr.write(p.stderr)
-    return p.returncode
-
 
 if __name__ == "__main__":
     raise SystemExit(main())
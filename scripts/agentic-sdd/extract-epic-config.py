@@ -6,6 +6,7 @@ Epicファイルをパースして技術選定情報、Q6要件、API設計情
 """
 
 import argparse
+import functools
 import json
 import re
 import sys
@@ -16,6 +17,40 @@ from md_sanitize import (
     sanitize_status_text,
 )
 
+# 「ラベル: [値]」形式の値（角括弧は任意）
+_LABEL_VALUE_TEMPLATE = r"{label}:\s*\[?([^\]\n]+)\]?"
+
+# 行頭の「PRD Q6-X:」パターン（ヘッダー内の「Yesの場合必須」を除外）
+_Q6_ANSWER_RES = {
+    n: re.compile(rf"^PRD Q6-{n}:\s*(Yes|No)\s*$", re.IGNORECASE | re.MULTILINE)
+    for n in (5, 6, 7, 8)
+}
+
+_AUTH_METHOD_RE = re.compile(_LABEL_VALUE_TEMPLATE.format(label="認証方式"))
+_AUTHZ_MODEL_RE = re.compile(_LABEL_VALUE_TEMPLATE.format(label="認可モデル"))
+_DATA_LIST_RE = re.compile(r"扱うデータ:\n((?:- [^\n]+\n?)+)")
+_PASSWORD_HASH_RE = re.compile(r"(bcrypt|argon2|scrypt|pbkdf2)")
+_PII_KEYWORDS = ("メール", "email", "名前", "name", "住所", "address", "電話", "phone")
+
+_TARGET_LIST_RE = re.compile(r"対象操作:\n((?:- [^\n]+\n?)+)")
+_TOOL_RE = re.compile(_LABEL_VALUE_TEMPLATE.format(label="ツール"))
+_ENV_RE = re.compile(_LABEL_VALUE_TEMPLATE.format(label="環境"))
+
+_LOG_OUTPUT_RE = re.compile(_LABEL_VALUE_TEMPLATE.format(label="出力先"))
+_LOG_FORMAT_RE = re.compile(_LABEL_VALUE_TEMPLATE.format(label="フォーマット"))
+_LOG_RETENTION_RE = re.compile(_LABEL_VALUE_TEMPLATE.format(label="保持期間"))
+
+_UPTIME_RE = re.compile(_LABEL_VALUE_TEMPLATE.format(label="稼働率"))
+_RTO_RE = re.compile(_LABEL_VALUE_TEMPLATE.format(label="RTO"))
+_RPO_RE = re.compile(_LABEL_VALUE_TEMPLATE.format(label="RPO"))
+
+# セクション終端（次の「#〜####」見出し行）の直前にある改行
+_SECTION_BOUNDARY_RE = re.compile(r"\n(?=#{1,4}\s)")
+
+_PRD_PATH_RE = re.compile(r"参照PRD:\s*`?([^`\n]+)`?")
+_CREATED_DATE_RE = re.compile(r"作成日:\s*(\d{4}-\d{2}-\d{2})")
+_STATUS_RE = re.compile(r"ステータス:\s*(Draft|Review|Approved)")
+
 
 def eprint(msg: str) -> None:
     print(msg, file=sys.stderr)
@@ -26,16 +61,28 @@ def read_text(path: str) -> str:
         return fh.read()
 
 
+@functools.lru_cache(maxsize=None)
+def _section_header_re(section_pattern: str) -> re.Pattern[str]:
+    # section_pattern は「3.2 技術選定」のような形式を想定
+    # Note: {{1,4}} はf-string内で {1,4} にエスケープされる
+    return re.compile(rf"#{{1,4}}\s*{section_pattern}")
+
+
+@functools.lru_cache(maxsize=None)
+def _key_value_block_re(block_prefix: str) -> re.Pattern[str]:
+    return re.compile(rf"{block_prefix}-\d+\n((?:[^\n]+: [^\n]+\n?)+)")
+
+
 def extract_section(text: str, section_pattern: str) -> Optional[str]:
     """指定されたセクションの内容を抽出する"""
     # セクションヘッダーから次のセクションヘッダーまでを抽出
-    # section_pattern は「3.2 技術選定」のような形式を想定
-    # Note: {{1,4}} はf-string内で {1,4} にエスケープされる
-    pattern = rf"(#{{1,4}}\s*{section_pattern}.*?)(?=\n#{{1,4}}\s|\Z)"
-    match = re.search(pattern, text, re.DOTALL)
-    if match:
-        return match.group(1).strip()
-    return None
+    match = _section_header_re(section_pattern).search(text)
+    if not match:
+        return None
+    # 終端は改行位置だけを走査して探す（DOTALL の遅延マッチで1文字ずつ先読みしない）
+    boundary = _SECTION_BOUNDARY_RE.search(text, match.end())
+    end = boundary.start() if boundary else len(text)
+    return text[match.start() : end].strip()
 
 
 def extract_key_value_block(text: str, block_prefix: str) -> List[Dict[str, str]]:
@@ -49,8 +96,7 @@ def extract_key_value_block(text: str, block_prefix: str) -> List[Dict[str, str]
     理由: ...
     """
     results = []
-    pattern = rf"{block_prefix}-\d+\n((?:[^\n]+: [^\n]+\n?)+)"
-    matches = re.findall(pattern, text)
+    matches = _key_value_block_re(block_prefix).findall(text)
 
     for match in matches:
         item = {}
@@ -110,10 +156,7 @@ def extract_q6_requirements(text: str) -> Dict[str, Any]:
     # セキュリティ（Q6-5）
     security_section = extract_section(text, r"5\.2\s+セキュリティ設計")
     if security_section:
-        # 行頭の「PRD Q6-X:」パターンを検索（ヘッダー内の「Yesの場合必須」を除外）
-        q6_match = re.search(
-            r"^PRD Q6-5:\s*(Yes|No)\s*$", security_section, re.IGNORECASE | re.MULTILINE
-        )
+        q6_match = _Q6_ANSWER_RES[5].search(security_section)
         if q6_match and q6_match.group(1).lower() == "yes":
             result["security"] = True
             result["details"]["security"] = extract_security_details(security_section)
@@ -121,9 +164,7 @@ def extract_q6_requirements(text: str) -> Dict[str, Any]:
     # パフォーマンス（Q6-7）
     perf_section = extract_section(text, r"5\.1\s+パフォーマンス設計")
     if perf_section:
-        q6_match = re.search(
-            r"^PRD Q6-7:\s*(Yes|No)\s*$", perf_section, re.IGNORECASE | re.MULTILINE
-        )
+        q6_match = _Q6_ANSWER_RES[7].search(perf_section)
         if q6_match and q6_match.group(1).lower() == "yes":
             result["performance"] = True
             result["details"]["performance"] = extract_performance_details(perf_section)
@@ -131,9 +172,7 @@ def extract_q6_requirements(text: str) -> Dict[str, Any]:
     # 観測性（Q6-6）
     obs_section = extract_section(text, r"5\.3\s+観測性設計")
     if obs_section:
-        q6_match = re.search(
-            r"^PRD Q6-6:\s*(Yes|No)\s*$", obs_section, re.IGNORECASE | re.MULTILINE
-        )
+        q6_match = _Q6_ANSWER_RES[6].search(obs_section)
         if q6_match and q6_match.group(1).lower() == "yes":
             result["observability"] = True
             result["details"]["observability"] = extract_observability_details(
@@ -143,9 +182,7 @@ def extract_q6_requirements(text: str) -> Dict[str, Any]:
     # 可用性（Q6-8）
     avail_section = extract_section(text, r"5\.4\s+可用性設計")
     if avail_section:
-        q6_match = re.search(
-            r"^PRD Q6-8:\s*(Yes|No)\s*$", avail_section, re.IGNORECASE | re.MULTILINE
-        )
+        q6_match = _Q6_ANSWER_RES[8].search(avail_section)
         if q6_match and q6_match.group(1).lower() == "yes":
             result["availability"] = True
             result["details"]["availability"] = extract_availability_details(
@@ -167,17 +204,17 @@ def extract_security_details(section: str) -> Dict[str, Any]:
     }
 
     # 認証方式
-    auth_match = re.search(r"認証方式:\s*\[?([^\]\n]+)\]?", section)
+    auth_match = _AUTH_METHOD_RE.search(section)
     if auth_match:
         details["auth_method"] = auth_match.group(1).strip()
 
     # 認可モデル
-    authz_match = re.search(r"認可モデル:\s*\[?([^\]\n]+)\]?", section)
+    authz_match = _AUTHZ_MODEL_RE.search(section)
     if authz_match:
         details["authz_model"] = authz_match.group(1).strip()
 
     # 扱うデータ
-    data_section = re.search(r"扱うデータ:\n((?:- [^\n]+\n?)+)", section)
+    data_section = _DATA_LIST_RE.search(section)
     if data_section:
         for line in data_section.group(1).strip().split("\n"):
             line = line.strip("- ").strip()
@@ -188,23 +225,11 @@ def extract_security_details(section: str) -> Dict[str, Any]:
                 )
                 # パスワードハッシュの検出
                 if "パスワード" in data_type.lower():
-                    hash_match = re.search(
-                        r"(bcrypt|argon2|scrypt|pbkdf2)", protection.lower()
-                    )
+                    hash_match = _PASSWORD_HASH_RE.search(protection.lower())
                     if hash_match:
                         details["password_hash"] = {"algorithm": hash_match.group(1)}
                 # PIIの検出
-                pii_keywords = [
-                    "メール",
-                    "email",
-                    "名前",
-                    "name",
-                    "住所",
-                    "address",
-                    "電話",
-                    "phone",
-                ]
-                if any(kw in data_type.lower() for kw in pii_keywords):
+                if any(kw in data_type.lower() for kw in _PII_KEYWORDS):
                     details["pii_list"].append(
                         {"name": data_type.strip(), "protection": protection.strip()}
                     )
@@ -217,7 +242,7 @@ def extract_performance_details(section: str) -> Dict[str, Any]:
     details: Dict[str, Any] = {"targets": [], "measurement": {}, "bottlenecks": []}
 
     # 対象操作
-    target_section = re.search(r"対象操作:\n((?:- [^\n]+\n?)+)", section)
+    target_section = _TARGET_LIST_RE.search(section)
     if target_section:
         for line in target_section.group(1).strip().split("\n"):
             line = line.strip("- ").strip()
@@ -228,11 +253,11 @@ def extract_performance_details(section: str) -> Dict[str, Any]:
                 )
 
     # 測定方法
-    tool_match = re.search(r"ツール:\s*\[?([^\]\n]+)\]?", section)
+    tool_match = _TOOL_RE.search(section)
     if tool_match:
         details["measurement"]["tool"] = tool_match.group(1).strip()
 
-    env_match = re.search(r"環境:\s*\[?([^\]\n]+)\]?", section)
+    env_match = _ENV_RE.search(section)
     if env_match:
         details["measurement"]["environment"] = env_match.group(1).strip()
 
@@ -244,15 +269,15 @@ def extract_observability_details(section: str) -> Dict[str, Any]:
     details: Dict[str, Any] = {"logging": {}, "metrics": [], "alerts": []}
 
     # ログ設定
-    output_match = re.search(r"出力先:\s*\[?([^\]\n]+)\]?", section)
+    output_match = _LOG_OUTPUT_RE.search(section)
     if output_match:
         details["logging"]["output"] = output_match.group(1).strip()
 
-    format_match = re.search(r"フォーマット:\s*\[?([^\]\n]+)\]?", section)
+    format_match = _LOG_FORMAT_RE.search(section)
     if format_match:
         details["logging"]["format"] = format_match.group(1).strip()
 
-    retention_match = re.search(r"保持期間:\s*\[?([^\]\n]+)\]?", section)
+    retention_match = _LOG_RETENTION_RE.search(section)
     if retention_match:
         details["logging"]["retention"] = retention_match.group(1).strip()
 
@@ -264,16 +289,16 @@ def extract_availability_details(section: str) -> Dict[str, Any]:
     details: Dict[str, Any] = {"slo": {}, "recovery": {}, "rollback": {}}
 
     # SLO
-    uptime_match = re.search(r"稼働率:\s*\[?([^\]\n]+)\]?", section)
+    uptime_match = _UPTIME_RE.search(section)
     if uptime_match:
         details["slo"]["uptime"] = uptime_match.group(1).strip()
 
     # RTO/RPO
-    rto_match = re.search(r"RTO:\s*\[?([^\]\n]+)\]?", section)
+    rto_match = _RTO_RE.search(section)
     if rto_match:
         details["recovery"]["rto"] = rto_match.group(1).strip()
 
-    rpo_match = re.search(r"RPO:\s*\[?([^\]\n]+)\]?", section)
+    rpo_match = _RPO_RE.search(section)
     if rpo_match:
         details["recovery"]["rpo"] = rpo_match.group(1).strip()
 
@@ -312,18 +337,18 @@ def extract_meta_info(text: str) -> Dict[str, Optional[str]]:
     }
 
     # 参照PRD
-    prd_match = re.search(r"参照PRD:\s*`?([^`\n]+)`?", text)
+    prd_match = _PRD_PATH_RE.search(text)
     if prd_match:
         meta["prd_path"] = prd_match.group(1).strip()
 
     # 作成日
-    date_match = re.search(r"作成日:\s*(\d{4}-\d{2}-\d{2})", text)
+    date_match = _CREATED_DATE_RE.search(text)
     if date_match:
         meta["created_date"] = date_match.group(1)
 
     # ステータス
     status_text = sanitize_status_text(text)
-    status_match = re.search(r"ステータス:\s*(Draft|Review|Approved)", status_text)
+    status_match = _STATUS_RE.search(status_text)
     if status_match:
         meta["status"] = status_match.group(1)
 
@@ -5,34 +5,38 @@
 extract-epic-config.py の出力を受け取り、テンプレートに変数置換してファイルを生成する。
 """
 
+from __future__ import annotations
+
 import argparse
+import functools
+import importlib.util
 import json
+import os
 import sys
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
 
-try:
-    from jinja2 import Environment, FileSystemLoader, select_autoescape
-except ImportError:
-    print(
-        "Error: jinja2 is required. Install with: pip install jinja2", file=sys.stderr
-    )
-    sys.exit(1)
+# jinja2 は実際にファイルを生成するときだけ import する（--help / --dry-run /
+# 入力エラーでは読み込まない）
+if TYPE_CHECKING:
+    from jinja2 import BytecodeCache, Environment
+
+    Generator = Callable[[Environment, Dict[str, Any], Path, Dict[str, Any]], str]
 
 
 def eprint(msg: str) -> None:
     print(msg, file=sys.stderr)
 
 
+@functools.lru_cache(maxsize=1)
 def find_repo_root() -> Path:
     """リポジトリのルートディレクトリを検出"""
-    current = Path.cwd()
-    while current != current.parent:
+    cwd = Path.cwd()
+    for current in (cwd, *cwd.parents):
         if (current / ".git").exists():
             return current
-        current = current.parent
-    return Path.cwd()
+    return cwd
 
 
 def load_config(config_path: str) -> Dict[str, Any]:
@@ -41,21 +45,99 @@ def load_config(config_path: str) -> Dict[str, Any]:
         return json.load(fh)
 
 
-def setup_jinja_env(template_dir: Path) -> Environment:
-    """Jinja2環境をセットアップ"""
-    env = Environment(
-        loader=FileSystemLoader(str(template_dir)),
-        autoescape=select_autoescape(["html", "xml"]),
-        trim_blocks=True,
-        lstrip_blocks=True,
+def extract_epic(extract_script: Path, epic_path: Path) -> Dict[str, Any]:
+    """extract-epic-config.py をプロセス内で読み込み、Epic から設定を抽出"""
+    name = "_agentic_sdd_extract_epic_config"
+    spec = importlib.util.spec_from_file_location(name, extract_script)
+    if spec is None or spec.loader is None:
+        raise RuntimeError(f"cannot load {extract_script}")
+    saved_path = list(sys.path)
+    try:
+        # extract-epic-config.py は同じディレクトリの md_sanitize を import する
+        sys.path.insert(0, str(extract_script.parent))
+        module = importlib.util.module_from_spec(spec)
+        # dataclasses などは sys.modules からモジュールを引く
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+        return module.extract_epic_config(str(epic_path))
+    finally:
+        sys.modules.pop(name, None)
+        sys.path[:] = saved_path
+
+
+def jinja_cache_dir() -> str:
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
     )
+    return os.path.join(base, "agentic-sdd", "jinja")
+
+
+def _bytecode_cache() -> Optional[BytecodeCache]:
+    from jinja2 import FileSystemBytecodeCache
+    from jinja2.bccache import Bucket
+
+    class BestEffortBytecodeCache(FileSystemBytecodeCache):
+        """Compiled-template cache whose write failures never fail generation."""
+
+        def dump_bytecode(self, bucket: Bucket) -> None:
+            try:
+                super().dump_bytecode(bucket)
+            except OSError:
+                pass
+
+    path = jinja_cache_dir()
+    try:
+        os.makedirs(path, exist_ok=True)
+    except OSError:
+        return None
+    return BestEffortBytecodeCache(path)
+
+
+# template_dir ごとに Environment を再利用し、コンパイル済みテンプレートを保持する
+_ENV_CACHE: Dict[Path, Environment] = {}
+
+
+def setup_jinja_env(template_dir: Path) -> Environment:
+    """Jinja2環境をセットアップ
+
+    コンパイル結果はプロセス内（Environment）とプロセス間（バイトコード
+    キャッシュ、テンプレート内容のハッシュで無効化）で再利用する。
+    """
+    env = _ENV_CACHE.get(template_dir)
+    if env is None:
+        try:
+            from jinja2 import Environment, FileSystemLoader, select_autoescape
+        except ImportError:
+            raise RuntimeError(
+                "jinja2 is required. Install with: pip install jinja2"
+            ) from None
+
+        env = Environment(
+            loader=FileSystemLoader(str(template_dir)),
+            autoescape=select_autoescape(["html", "xml"]),
+            trim_blocks=True,
+            lstrip_blocks=True,
+            bytecode_cache=_bytecode_cache(),
+        )
+        _ENV_CACHE[template_dir] = env
     return env
 
 
+def build_base_context(config: Dict[str, Any]) -> Dict[str, Any]:
+    """全テンプレート共通のコンテキスト（generate_all で1回だけ構築）"""
+    meta = config.get("meta") or {}
+    return {
+        "epic_path": config.get("epic_path") or "",
+        "prd_path": meta.get("prd_path") or "",
+    }
+
+
 def generate_config_json(
     env: Environment,
     config: Dict[str, Any],
     output_dir: Path,
+    base_context: Dict[str, Any],
+    generated_at: str,
     generated_skills: List[str],
     generated_rules: List[str],
 ) -> str:
@@ -63,9 +145,8 @@ def generate_config_json(
     template = env.get_template("config.json.j2")
 
     context = {
-        "epic_path": config.get("epic_path", ""),
-        "prd_path": config.get("meta", {}).get("prd_path"),
-        "generated_at": datetime.now().isoformat(),
+        **base_context,
+        "generated_at": generated_at,
         "tech_stack": config.get("tech_stack", {}),
         "requirements": config.get("requirements", {}),
         "generated_skills": generated_skills,
@@ -79,29 +160,47 @@ def generate_config_json(
     return str(output_path)
 
 
+def has_security(config: Dict[str, Any]) -> bool:
+    return bool(config.get("requirements", {}).get("security"))
+
+
+def has_performance(config: Dict[str, Any]) -> bool:
+    return bool(config.get("requirements", {}).get("performance"))
+
+
+def has_api_design(config: Dict[str, Any]) -> bool:
+    return bool(config.get("api_design"))
+
+
+# 技術スタックスキルの生成条件に使うキー
+TECH_STACK_KEYS = ("language", "framework", "database", "infrastructure")
+
+
+def has_tech_stack(config: Dict[str, Any]) -> bool:
+    """技術選定情報が1つでもあれば生成"""
+    tech_stack = config.get("tech_stack", {})
+    return any(tech_stack.get(key) for key in TECH_STACK_KEYS)
+
+
 def generate_security_rules(
     env: Environment,
     config: Dict[str, Any],
     output_dir: Path,
-) -> Optional[str]:
+    base_context: Dict[str, Any],
+) -> str:
     """セキュリティルールを生成"""
-    requirements = config.get("requirements", {})
-    if not requirements.get("security"):
-        return None
-
     template = env.get_template("rules/security.md.j2")
 
+    requirements = config.get("requirements", {})
     security_details = requirements.get("details", {}).get("security", {})
 
     context = {
-        "epic_path": config.get("epic_path", ""),
-        "prd_path": config.get("meta", {}).get("prd_path", ""),
+        **base_context,
         "security_details": security_details,
     }
 
     content = template.render(**context)
     output_path = output_dir / "rules" / "security.md"
-    output_path.parent.mkdir(parents=True, exist_ok=True)
     output_path.write_text(content, encoding="utf-8")
 
     return str(output_path)
@@ -111,25 +210,21 @@ def generate_performance_rules(
     env: Environment,
     config: Dict[str, Any],
     output_dir: Path,
-) -> Optional[str]:
+    base_context: Dict[str, Any],
+) -> str:
     """パフォーマンスルールを生成"""
-    requirements = config.get("requirements", {})
-    if not requirements.get("performance"):
-        return None
-
     template = env.get_template("rules/performance.md.j2")
 
+    requirements = config.get("requirements", {})
     performance_details = requirements.get("details", {}).get("performance", {})
 
     context = {
-        "epic_path": config.get("epic_path", ""),
-        "prd_path": config.get("meta", {}).get("prd_path", ""),
+        **base_context,
         "performance_details": performance_details,
     }
 
     content = template.render(**context)
     output_path = output_dir / "rules" / "performance.md"
-    output_path.parent.mkdir(parents=True, exist_ok=True)
     output_path.write_text(content, encoding="utf-8")
 
     return str(output_path)
@@ -139,23 +234,18 @@ def generate_api_conventions(
     env: Environment,
     config: Dict[str, Any],
     output_dir: Path,
-) -> Optional[str]:
+    base_context: Dict[str, Any],
+) -> str:
     """API規約を生成"""
-    api_design = config.get("api_design", [])
-    if not api_design:
-        return None
-
     template = env.get_template("rules/api-conventions.md.j2")
 
     context = {
-        "epic_path": config.get("epic_path", ""),
-        "prd_path": config.get("meta", {}).get("prd_path", ""),
-        "api_endpoints": api_design,
+        **base_context,
+        "api_endpoints": config.get("api_design", []),
     }
 
     content = template.render(**context)
     output_path = output_dir / "rules" / "api-conventions.md"
-    output_path.parent.mkdir(parents=True, exist_ok=True)
     output_path.write_text(content, encoding="utf-8")
 
     return str(output_path)
@@ -165,38 +255,33 @@ def generate_tech_stack_skill(
     env: Environment,
     config: Dict[str, Any],
     output_dir: Path,
-) -> Optional[str]:
+    base_context: Dict[str, Any],
+) -> str:
     """技術スタックスキルを生成"""
-    tech_stack = config.get("tech_stack", {})
-    # 技術選定情報が1つでもあれば生成
-    has_tech = any(
-        [
-            tech_stack.get("language"),
-            tech_stack.get("framework"),
-            tech_stack.get("database"),
-            tech_stack.get("infrastructure"),
-        ]
-    )
-
-    if not has_tech:
-        return None
-
     template = env.get_template("skills/tech-stack.md.j2")
 
     context = {
-        "epic_path": config.get("epic_path", ""),
-        "prd_path": config.get("meta", {}).get("prd_path", ""),
-        "tech_stack": tech_stack,
+        **base_context,
+        "tech_stack": config.get("tech_stack", {}),
     }
 
     content = template.render(**context)
     output_path = output_dir / "skills" / "tech-stack.md"
-    output_path.parent.mkdir(parents=True, exist_ok=True)
     output_path.write_text(content, encoding="utf-8")
 
     return str(output_path)
 
 
+# config.json 以外の生成対象（この順で生成する）:
+# (種別 skills/rules, ファイル名, 生成条件, 生成関数)
+GENERATORS: Tuple[Tuple[str, str, Callable[[Dict[str, Any]], bool], Generator], ...] = (
+    ("skills", "tech-stack.md", has_tech_stack, generate_tech_stack_skill),
+    ("rules", "security.md", has_security, generate_security_rules),
+    ("rules", "performance.md", has_performance, generate_performance_rules),
+    ("rules", "api-conventions.md", has_api_design, generate_api_conventions),
+)
+
+
 def generate_all(
     config: Dict[str, Any],
     template_dir: Path,
@@ -204,75 +289,46 @@ def generate_all(
     dry_run: bool = False,
 ) -> Dict[str, Any]:
     """すべてのファイルを生成"""
-    env = setup_jinja_env(template_dir)
+    generated: Dict[str, List[str]] = {"skills": [], "rules": []}
+    selected: List[Tuple[str, Generator]] = []
+    for kind, name, should_generate, generate in GENERATORS:
+        if should_generate(config):
+            generated[kind].append(name)
+            selected.append((kind, generate))
 
-    generated_skills: List[str] = []
-    generated_rules: List[str] = []
     generated_files: List[str] = []
 
-    # 出力ディレクトリを作成
+    # dry-run はテンプレートを描画しないので Jinja2 環境も作らない
     if not dry_run:
-        output_dir.mkdir(parents=True, exist_ok=True)
+        env = setup_jinja_env(template_dir)
+        base_context = build_base_context(config)
+        # Agentic-SDD datetime rule: YYYY-MM-DDTHH:mm:ssZ (UTC, no milliseconds).
+        generated_at = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
-    # 技術スタックスキル
-    if not dry_run:
-        skill_path = generate_tech_stack_skill(env, config, output_dir)
-        if skill_path:
-            generated_skills.append("tech-stack.md")
-            generated_files.append(skill_path)
-    else:
-        tech_stack = config.get("tech_stack", {})
-        if any(
-            [
-                tech_stack.get("language"),
-                tech_stack.get("framework"),
-                tech_stack.get("database"),
-                tech_stack.get("infrastructure"),
-            ]
-        ):
-            generated_skills.append("tech-stack.md")
-
-    # セキュリティルール
-    if not dry_run:
-        rule_path = generate_security_rules(env, config, output_dir)
-        if rule_path:
-            generated_rules.append("security.md")
-            generated_files.append(rule_path)
-    else:
-        if config.get("requirements", {}).get("security"):
-            generated_rules.append("security.md")
-
-    # パフォーマンスルール
-    if not dry_run:
-        rule_path = generate_performance_rules(env, config, output_dir)
-        if rule_path:
-            generated_rules.append("performance.md")
-            generated_files.append(rule_path)
-    else:
-        if config.get("requirements", {}).get("performance"):
-            generated_rules.append("performance.md")
+        # 出力ディレクトリを作成（skills/ と rules/ は使うものだけ1回ずつ）
+        output_dir.mkdir(parents=True, exist_ok=True)
+        for kind in dict.fromkeys(kind for kind, _ in selected):
+            (output_dir / kind).mkdir(exist_ok=True)
 
-    # API規約
-    if not dry_run:
-        rule_path = generate_api_conventions(env, config, output_dir)
-        if rule_path:
-            generated_rules.append("api-conventions.md")
-            generated_files.append(rule_path)
-    else:
-        if config.get("api_design"):
-            generated_rules.append("api-conventions.md")
+        for _, generate in selected:
+            generated_files.append(generate(env, config, output_dir, base_context))
 
-    # config.json を最後に生成（生成ファイル一覧を含めるため）
-    if not dry_run:
+        # config.json を最後に生成（生成ファイル一覧を含めるため）
         config_path = generate_config_json(
-            env, config, output_dir, generated_skills, generated_rules
+            env,
+            config,
+            output_dir,
+            base_context,
+            generated_at,
+            generated["skills"],
+            generated["rules"],
         )
-        generated_files.insert(0, config_path)
+        generated_files = [config_path, *generated_files]
 
     return {
         "output_dir": str(output_dir),
-        "generated_skills": generated_skills,
-        "generated_rules": generated_rules,
+        "generated_skills": generated["skills"],
+        "generated_rules": generated["rules"],
         "generated_files": generated_files,
     }
 
@@ -313,8 +369,6 @@ def main() -> int:
         config = load_config(str(config_path))
     elif config_path.suffix == ".md":
         # Epicファイルの場合は extract-epic-config.py を呼び出す
-        import subprocess
-
         script_dir = Path(__file__).parent
         extract_script = script_dir / "extract-epic-config.py"
 
@@ -322,34 +376,33 @@ def main() -> int:
             eprint(f"Error: extract-epic-config.py not found at {extract_script}")
             return 1
 
-        proc = subprocess.run(  # noqa: S603
-            [sys.executable, str(extract_script), str(config_path)],
-            capture_output=True,
-            text=True,
-        )
-        if proc.returncode != 0:
-            eprint(f"Error: Failed to extract config: {proc.stderr}")
+        try:
+            config = extract_epic(extract_script, config_path)
+        except Exception as e:
+            eprint(f"Error: Failed to extract config: {e}")
             return 1
-
-        config = json.loads(proc.stdout)
     else:
         eprint(f"Error: Unsupported file type: {config_path.suffix}")
         return 1
 
     # テンプレートディレクトリを解決
+    # 各候補は1回だけ stat する
     if args.template_dir:
         template_dir = Path(args.template_dir)
+        found = template_dir.exists()
     else:
         # スクリプトの場所から相対パスで検索
         script_dir = Path(__file__).parent
         repo_root = script_dir.parent
         template_dir = repo_root / "templates" / "project-config"
+        found = template_dir.exists()
 
-        if not template_dir.exists():
+        if not found:
             # カレントディレクトリからも検索
             template_dir = find_repo_root() / "templates" / "project-config"
+            found = template_dir.exists()
 
-    if not template_dir.exists():
+    if not found:
         eprint(f"Error: Template directory not found: {template_dir}")
         return 1
 
@@ -364,27 +417,28 @@ def main() -> int:
     if args.json:
         print(json.dumps(result, ensure_ascii=False, indent=2))
     else:
+        # 行をまとめて1回で出力する
+        lines: List[str] = []
         if args.dry_run:
-            print("=== Dry Run: 生成予定のファイル ===")
+            lines.append("=== Dry Run: 生成予定のファイル ===")
         else:
-            print("=== 生成完了 ===")
+            lines.append("=== 生成完了 ===")
 
-        print(f"\n出力ディレクトリ: {result['output_dir']}")
+        lines.append(f"\n出力ディレクトリ: {result['output_dir']}")
 
         if result["generated_skills"]:
-            print("\nスキル:")
-            for skill in result["generated_skills"]:
-                print(f"  - skills/{skill}")
+            lines.append("\nスキル:")
+            lines.extend(f"  - skills/{skill}" for skill in result["generated_skills"])
 
         if result["generated_rules"]:
-            print("\nルール:")
-            for rule in result["generated_rules"]:
-                print(f"  - rules/{rule}")
+            lines.append("\nルール:")
+            lines.extend(f"  - rules/{rule}" for rule in result["generated_rules"])
 
         if not args.dry_run:
-            print("\n生成ファイル一覧:")
-            for f in result["generated_files"]:
-                print(f"  - {f}")
+            lines.append("\n生成ファイル一覧:")
+            lines.extend(f"  - {f}" for f in result["generated_files"])
+
+        print("\n".join(lines))
 
     return 0
 
@@ -0,0 +1,74 @@
+"""Short-lived on-disk cache for `gh issue view` results.
+
+One workflow step often asks gh for the same Issue several times.  Entries
+live under `$XDG_CACHE_HOME/agentic-sdd/<kind>/` and are reused for
+GH_CACHE_TTL_SECONDS; an entry missing any expected string field is a miss.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from typing import Callable, Dict, Optional, Sequence
+
+# Issue data fetched via gh is reused for this long (seconds)
+GH_CACHE_TTL_SECONDS = 60
+
+
+def cache_path(kind: str, scope: str, issue: str) -> str:
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    key = hashlib.sha256(f"{scope}|{issue}".encode("utf-8")).hexdigest()[:16]
+    return os.path.join(base, "agentic-sdd", kind, f"{key}.json")
+
+
+def _load(path: str, fields: Sequence[str]) -> Optional[Dict[str, str]]:
+    try:
+        if time.time() - os.path.getmtime(path) >= GH_CACHE_TTL_SECONDS:
+            return None
+        with open(path, "r", encoding="utf-8") as fh:
+            data = json.load(fh)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict):
+        return None
+    if not all(isinstance(data.get(f), str) for f in fields):
+        return None
+    return {f: data[f] for f in fields}
+
+
+def cached_gh_fetch(
+    kind: str,
+    scope: str,
+    issue: str,
+    fields: Sequence[str],
+    fetch: Callable[[], Dict[str, str]],
+) -> Dict[str, str]:
+    """Return `fields` for `issue`, calling `fetch` only on a cache miss.
+
+    `scope` must identify the repository gh resolves (the -R value, or the
+    directory gh runs in when -R is omitted).
+    """
+    path = cache_path(kind, scope, issue)
+    cached = _load(path, fields)
+    if cached is not None:
+        return cached
+
+    data = fetch()
+
+    # The cache only saves a round trip; failing to write it is not an error.
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump({f: data[f] for f in fields}, fh, ensure_ascii=False)
+        os.replace(tmp, path)
+    except OSError:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+    return data
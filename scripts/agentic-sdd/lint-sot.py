@@ -1,20 +1,22 @@
 #!/usr/bin/env python3
 
 import argparse
+import functools
 import os
 import re
 import shutil
 import subprocess
 import sys
 from dataclasses import dataclass
-from typing import Iterable, List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from md_sanitize import (
     sanitize_status_text,
+    strip_code_blocks,
     strip_fenced_code_blocks,
     strip_html_comment_blocks,
-    strip_indented_code_blocks,
 )
+from repo_root_cache import cached_repo_root
 
 
 @dataclass(frozen=True)
@@ -27,37 +29,63 @@ def eprint(msg: str) -> None:
     print(msg, file=sys.stderr)
 
 
-def repo_root() -> str:
+def _git_toplevel() -> Optional[str]:
     git_bin = shutil.which("git")
     if not git_bin:
-        return os.path.realpath(os.getcwd())
+        return None
 
     try:
         p = subprocess.run(  # noqa: S603
             [git_bin, "rev-parse", "--show-toplevel"],
             text=True,
             stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             check=False,  # noqa: S603
         )
     except Exception:
-        return os.path.realpath(os.getcwd())
+        return None
 
     root = (p.stdout or "").strip()
     if not root:
-        return os.path.realpath(os.getcwd())
+        return None
     return os.path.realpath(root)
 
 
+def repo_root() -> str:
+    root = cached_repo_root(_git_toplevel)
+    if not root:
+        return os.path.realpath(os.getcwd())
+    return root
+
+
+_SKIP_DIR_NAMES = {".git", ".agentic-sdd"}
+
+
 def iter_markdown_files(root: str) -> Iterable[str]:
-    for dirpath, dirnames, filenames in os.walk(root):
-        dirnames[:] = [d for d in dirnames if d not in {".git", ".agentic-sdd"}]
-        dirnames.sort()
-        filenames.sort()
-        for name in filenames:
-            if not name.endswith(".md"):
-                continue
-            yield os.path.join(dirpath, name)
+    """Yield *.md paths under root in the order of a sorted top-down os.walk.
+
+    Walks os.scandir() directly so the DirEntry type info from the directory
+    read is reused and symlinked directories are skipped without an extra
+    lstat() per subdirectory.
+    """
+    try:
+        with os.scandir(root) as it:
+            entries = sorted(it, key=lambda e: e.name)
+    except OSError:
+        return
+    subdirs: List[str] = []
+    for entry in entries:
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            is_dir = False
+        if is_dir:
+            if entry.name not in _SKIP_DIR_NAMES and not entry.is_symlink():
+                subdirs.append(entry.path)
+        elif entry.name.endswith(".md"):
+            yield entry.path
+    for path in subdirs:
+        yield from iter_markdown_files(path)
 
 
 def is_safe_repo_relative_root(root: str) -> bool:
@@ -83,6 +111,8 @@ def read_text(path: str) -> str:
         return fh.read()
 
 
+# PRDs and Epics carry a ステータス line and the Approved-only checks.
+_STATUS_DOC_PREFIXES = ("docs/prd/", "docs/epics/")
 _STATUS_APPROVED_RE = re.compile(r"^\s*-\s*ステータス\s*:\s*Approved\s*$", re.MULTILINE)
 _STATUS_ANY_RE = re.compile(r"^\s*-\s*ステータス\s*:\s*\S", re.MULTILINE)
 _ALLOW_HTML_COMMENTS_RE = re.compile(r"<!--\s*lint-sot:\s*allow-html-comments\s*-->")
@@ -91,15 +121,22 @@ _SOT_REFERENCE_PRD_LINE_RE = re.compile(
 )
 
 
-_RESEARCH_CANDIDATE_BLOCK_RE = re.compile(
-    r"^\s*候補-(\d+)\s*$.*?(?=^\s*候補-\d+\s*$|^\s*#{1,6}\s|^\s*---\s*$|\Z)",
-    re.MULTILINE | re.DOTALL,
+# A candidate block runs from its '候補-N' line up to the next boundary line:
+# another candidate, any heading, or a '---' rule.
+_RESEARCH_CANDIDATE_RE = re.compile(r"^\s*候補-(\d+)\s*$", re.MULTILINE)
+_RESEARCH_CANDIDATE_END_RE = re.compile(
+    r"^\s*候補-\d+\s*$|^\s*#{1,6}\s|^\s*---\s*$", re.MULTILINE
 )
 _RESEARCH_ADJACENT_RE = re.compile(r"^\s*隣接領域-(\d+)\s*$", re.MULTILINE)
 _RESEARCH_ABSTRACTION_RE = re.compile(r"^\s*抽象化-(\d+)\s*$", re.MULTILINE)
 _RESEARCH_NOVELTY_YES_BULLET_RE = re.compile(
     r"^\s*-\s*(.+?)\s*:\s*Yes\s*$", re.MULTILINE
 )
+# Greedy prefix: a trigger satisfied by any answered ':' on the line is also
+# inside the prefix ending at the last one.
+_RESEARCH_NOVELTY_ANSWER_RE = re.compile(
+    r"^\s*-\s*(.*):\s*(?:Yes|No)\s*$", re.MULTILINE
+)
 _RESEARCH_NOVELTY_H2_RE = re.compile(
     r"^\s*##\s*(?:\d+\.\s*)?新規性判定（発火条件）\s*$", re.MULTILINE
 )
@@ -107,10 +144,15 @@ _RESEARCH_ADJACENT_H2_RE = re.compile(
     r"^\s*##\s*(?:\d+\.\s*)?隣接領域探索.*$", re.MULTILINE
 )
 _RESEARCH_ANY_H2_RE = re.compile(r"^\s*##\s+", re.MULTILINE)
-_RESEARCH_EVIDENCE_URL_RE = re.compile(r"^\s*-\s*https?://\S+", re.MULTILINE)
 _RESEARCH_APPLICABILITY_RE = re.compile(
     r"^\s*適用可否:[ \t]*(Yes|Partial|No)[ \t]*$", re.MULTILINE
 )
+_RESEARCH_APPLICABILITY_LINE_RE = re.compile(
+    r"^\s*適用可否:[ \t]*[^\n]*$", re.MULTILINE
+)
+_RESEARCH_DATE_ARTIFACT_RE = re.compile(r"^\d{4}-\d{2}-\d{2}\.md$")
+_RESEARCH_NOVELTY_UNFILLED_RE = re.compile(r":\s*Yes\s*/\s*No\s*$", re.MULTILINE)
+_RESEARCH_ADJACENT_NA_RE = re.compile(r"^\s*隣接領域探索\s*:\s*N/A", re.MULTILINE)
 _RESEARCH_CANDIDATE_REQUIRED_LABELS = [
     "概要:",
     "適用可否:",
@@ -121,6 +163,24 @@ _RESEARCH_CANDIDATE_REQUIRED_LABELS = [
     "捨て条件:",
     "リスク/検証:",
 ]
+_RESEARCH_CANDIDATE_LABEL_RES = {
+    label: re.compile(rf"^\s*{re.escape(label)}", re.MULTILINE)
+    for label in _RESEARCH_CANDIDATE_REQUIRED_LABELS
+}
+# has_candidate_evidence_url scans a block re-joined on "\n"; [^\S\n] keeps
+# each match on one line, like the line-by-line strip()/startswith checks.
+_RESEARCH_EVIDENCE_LABEL_RE = re.compile(r"^[^\S\n]*根拠リンク:", re.MULTILINE)
+_RESEARCH_EVIDENCE_END_RE = re.compile(
+    r"^[^\S\n]*(?:"
+    + "|".join(
+        re.escape(label)
+        for label in _RESEARCH_CANDIDATE_REQUIRED_LABELS
+        if label != "根拠リンク:"
+    )
+    + ")",
+    re.MULTILINE,
+)
+_RESEARCH_EVIDENCE_URL_RE = re.compile(r"^[^\S\n]*-[^\S\n]*https?://\S", re.MULTILINE)
 _RESEARCH_NOVELTY_REQUIRED_SUBSTRINGS = [
     "直接の先行事例が2件未満",
     "Unknown",
@@ -152,6 +212,18 @@ _RESEARCH_EPIC_SERVICE_BULLET_RE = re.compile(
 _RESEARCH_EPIC_WEIGHT_BULLET_RE = re.compile(
     r"^\s*-\s*.+（\d{1,3}%）\s*$", re.MULTILINE
 )
+_RESEARCH_EPIC_BULLET_RE = re.compile(r"^\s*-\s+.+$", re.MULTILINE)
+_RESEARCH_EPIC_GATE_LABELS = [
+    "比較対象サービス:",
+    "代替系統カバレッジ:",
+    "評価軸（重み）:",
+    "定量比較表:",
+    "判定理由:",
+]
+_RESEARCH_EPIC_GATE_LABEL_RES = {
+    label: re.compile(rf"^\s*{re.escape(label)}\s*$", re.MULTILINE)
+    for label in _RESEARCH_EPIC_GATE_LABELS
+}
 
 _RESEARCH_EPIC_REQUIRED_TABLE_COLUMNS = [
     "サービス名",
@@ -203,78 +275,103 @@ def is_research_adjacent_exploration_required(text: str) -> bool:
     return False
 
 
+def extract_candidate_blocks(text: str) -> List[Tuple[str, str]]:
+    """Return (number, block) for each '候補-N' block, in document order."""
+    blocks: List[Tuple[str, str]] = []
+    if "候補-" not in text:
+        return blocks
+    pos = 0
+    while True:
+        m = _RESEARCH_CANDIDATE_RE.search(text, pos)
+        if not m:
+            return blocks
+        m_end = _RESEARCH_CANDIDATE_END_RE.search(text, m.end())
+        pos = m_end.start() if m_end else len(text)
+        blocks.append((m.group(1), text[m.start() : pos]))
+
+
 def has_candidate_evidence_url(block: str) -> bool:
-    in_evidence = False
-    for line in block.splitlines():
-        s = line.strip()
-        if not in_evidence:
-            if s.startswith("根拠リンク:"):
-                in_evidence = True
-            continue
+    """True if a URL bullet follows '根拠リンク:' before the next field label."""
+    # splitlines() + "\n" turns every line break into "\n" for the anchors.
+    text = "\n".join(block.splitlines())
+    m = _RESEARCH_EVIDENCE_LABEL_RE.search(text)
+    if not m:
+        return False
+    start = text.find("\n", m.end()) + 1
+    if start == 0:
+        return False
+    m_end = _RESEARCH_EVIDENCE_END_RE.search(text, start)
+    end = m_end.start() if m_end else len(text)
+    return _RESEARCH_EVIDENCE_URL_RE.search(text, start, end) is not None
 
-        if any(s.startswith(x) for x in _RESEARCH_CANDIDATE_REQUIRED_LABELS):
-            if not s.startswith("根拠リンク:"):
-                break
 
-        if _RESEARCH_EVIDENCE_URL_RE.search(line):
-            return True
-    return False
+_LABEL_LINE_RES: Dict[Tuple[str, ...], re.Pattern[str]] = {}
+
+
+def _label_line_re(labels: Tuple[str, ...]) -> re.Pattern[str]:
+    """Match a line that is exactly one of labels, give or take whitespace."""
+    pattern = _LABEL_LINE_RES.get(labels)
+    if pattern is None:
+        alternation = "|".join(re.escape(label) for label in labels)
+        pattern = re.compile(rf"^[^\S\n]*(?:{alternation})[^\S\n]*$", re.MULTILINE)
+        _LABEL_LINE_RES[labels] = pattern
+    return pattern
 
 
 def extract_labeled_block(section: str, start_label: str, end_labels: List[str]) -> str:
-    in_block = False
-    out: List[str] = []
-    for line in section.splitlines():
-        s = line.strip()
-        if not in_block:
-            if s == start_label:
-                in_block = True
-            continue
+    """Return the lines between the start label line and the next end label line."""
+    # splitlines() + "\n" turns every line break into "\n" for the anchors.
+    text = "\n".join(section.splitlines())
+    m = _label_line_re((start_label,)).search(text)
+    if not m:
+        return ""
+    start = text.find("\n", m.end()) + 1
+    if start == 0:
+        return ""
+    m_end = (
+        _label_line_re(tuple(end_labels)).search(text, start) if end_labels else None
+    )
+    return text[start : m_end.start() - 1] if m_end else text[start:]
+
+
+_MD_TABLE_SEPARATOR_RE = re.compile(r"\|\s*[-:| ]+\|?\s*")
 
-        if s in end_labels:
-            break
-        out.append(line)
-    return "\n".join(out)
+
+def _table_row_body(row: str) -> str:
+    body = row[1:]
+    if body.endswith("|"):
+        body = body[:-1]
+    return body
 
 
 def count_markdown_table_rows_with_headers(
     section: str, required_headers: List[str]
 ) -> int:
-    def parse_table_cells(row: str) -> List[str]:
-        s = row.strip()
-        body = s[1:]
-        if body.endswith("|"):
-            body = body[:-1]
-        return [c.strip() for c in body.split("|")]
-
     lines = section.splitlines()
     for i, line in enumerate(lines):
         s = line.strip()
         if not s.startswith("|"):
             continue
+        # A header cell equal to h implies h occurs in the row, so rows that
+        # lack a header as a substring are skipped without splitting.
+        if not all(h in s for h in required_headers):
+            continue
 
-        header_cells = parse_table_cells(s)
+        header_cells = [c.strip() for c in _table_row_body(s).split("|")]
         if not all(h in header_cells for h in required_headers):
             continue
 
         count = 0
         expected_cols = len(header_cells)
-        j = i + 1
-        while j < len(lines):
-            t = lines[j].strip()
+        for row in lines[i + 1 :]:
+            t = row.strip()
             if not t.startswith("|"):
                 break
-            if re.fullmatch(r"\|\s*[-:| ]+\|?\s*", t):
-                j += 1
-                continue
-
-            row_cells = parse_table_cells(t)
-            if len(row_cells) != expected_cols:
-                j += 1
+            if _MD_TABLE_SEPARATOR_RE.fullmatch(t):
                 continue
-
-            count += 1
-            j += 1
+            # Data rows only need their column count, not the cells.
+            if _table_row_body(t).count("|") + 1 == expected_cols:
+                count += 1
         return count
     return -1
 
@@ -324,15 +421,8 @@ def lint_epic_external_service_comparison(
     if has_skip:
         return errs
 
-    labels = [
-        "比較対象サービス:",
-        "代替系統カバレッジ:",
-        "評価軸（重み）:",
-        "定量比較表:",
-        "判定理由:",
-    ]
-    for label in labels:
-        if re.search(rf"^\s*{re.escape(label)}\s*$", section, re.MULTILINE) is None:
+    for label in _RESEARCH_EPIC_GATE_LABELS:
+        if _RESEARCH_EPIC_GATE_LABEL_RES[label].search(section) is None:
             errs.append(
                 LintError(
                     path=rel_path,
@@ -367,7 +457,7 @@ def lint_epic_external_service_comparison(
         start_label="代替系統カバレッジ:",
         end_labels=["評価軸（重み）:", "定量比較表:", "判定理由:"],
     )
-    family_count = len(re.findall(r"^\s*-\s+.+$", family_block, re.MULTILINE))
+    family_count = len(_RESEARCH_EPIC_BULLET_RE.findall(family_block))
     if family_count < 3:
         errs.append(
             LintError(
@@ -425,7 +515,7 @@ def lint_epic_external_service_comparison(
         start_label="判定理由:",
         end_labels=[],
     )
-    if re.search(r"^\s*-\s+.+$", reason_block, re.MULTILINE) is None:
+    if _RESEARCH_EPIC_BULLET_RE.search(reason_block) is None:
         errs.append(
             LintError(
                 path=rel_path,
@@ -439,11 +529,28 @@ def lint_epic_external_service_comparison(
     return errs
 
 
+# lint_paths hands the same text object to every linter, so a one-entry cache
+# computes each sanitized view once per file instead of once per linter.
+@functools.lru_cache(maxsize=1)
+def _fenced_stripped_text(text: str) -> str:
+    return strip_fenced_code_blocks(text)
+
+
+@functools.lru_cache(maxsize=1)
+def _status_text(text: str) -> str:
+    return sanitize_status_text(text)
+
+
+@functools.lru_cache(maxsize=1)
+def _link_scan_text(text: str) -> str:
+    return strip_inline_code_spans(_fenced_stripped_text(text))
+
+
 def is_approved_prd_or_epic(rel_path: str, text: str) -> bool:
-    if rel_path.startswith("docs/prd/") or rel_path.startswith("docs/epics/"):
+    if rel_path.startswith(_STATUS_DOC_PREFIXES):
         if os.path.basename(rel_path) == "_template.md":
             return False
-        status_text = sanitize_status_text(text)
+        status_text = _status_text(text)
         return _STATUS_APPROVED_RE.search(status_text) is not None
     return False
 
@@ -457,14 +564,13 @@ def lint_status_format(rel_path: str, text: str) -> List[LintError]:
     from indented code blocks.  Emit an explicit error instead of
     silently skipping Approved-only checks.
     """
-    if not (rel_path.startswith("docs/prd/") or rel_path.startswith("docs/epics/")):
+    if not rel_path.startswith(_STATUS_DOC_PREFIXES):
         return []
     if os.path.basename(rel_path) == "_template.md":
         return []
 
-    fenced_stripped = strip_fenced_code_blocks(text)
-    partial = strip_html_comment_blocks(fenced_stripped)
-    full = sanitize_status_text(text)
+    partial = strip_html_comment_blocks(_fenced_stripped_text(text))
+    full = _status_text(text)
 
     if _STATUS_ANY_RE.search(partial) and not _STATUS_ANY_RE.search(full):
         return [
@@ -497,7 +603,7 @@ def lint_research_contract(rel_path: str, text: str) -> List[LintError]:
         "docs/research/epic/_template.md",
         "docs/research/estimation/_template.md",
     }
-    is_date_artifact = re.match(r"^\d{4}-\d{2}-\d{2}\.md$", base) is not None
+    is_date_artifact = _RESEARCH_DATE_ARTIFACT_RE.match(base) is not None
 
     if not is_template and not is_date_artifact:
         return [
@@ -516,12 +622,10 @@ def lint_research_contract(rel_path: str, text: str) -> List[LintError]:
     errs: List[LintError] = []
 
     contract_text = strip_html_comment_blocks(
-        strip_inline_code_spans(
-            strip_indented_code_blocks(strip_fenced_code_blocks(text))
-        )
+        strip_inline_code_spans(strip_code_blocks(text))
     )
 
-    candidate_blocks = list(_RESEARCH_CANDIDATE_BLOCK_RE.finditer(contract_text))
+    candidate_blocks = extract_candidate_blocks(contract_text)
     if len(candidate_blocks) < 5:
         errs.append(
             LintError(
@@ -534,12 +638,10 @@ def lint_research_contract(rel_path: str, text: str) -> List[LintError]:
         )
 
     required_field_labels = _RESEARCH_CANDIDATE_REQUIRED_LABELS
-    for m in candidate_blocks:
-        n_raw = m.group(1)
-        block = m.group(0)
+    for n_raw, block in candidate_blocks:
         cand = f"候補-{n_raw}"
         for label in required_field_labels:
-            if re.search(rf"^\s*{re.escape(label)}", block, re.MULTILINE) is None:
+            if _RESEARCH_CANDIDATE_LABEL_RES[label].search(block) is None:
                 errs.append(
                     LintError(
                         path=rel_path,
@@ -551,9 +653,7 @@ def lint_research_contract(rel_path: str, text: str) -> List[LintError]:
                 )
 
         if not is_template:
-            applicability_lines = re.findall(
-                r"^\s*適用可否:[ \t]*[^\n]*$", block, re.MULTILINE
-            )
+            applicability_lines = _RESEARCH_APPLICABILITY_LINE_RE.findall(block)
             if len(applicability_lines) != 1:
                 errs.append(
                     LintError(
@@ -575,9 +675,11 @@ def lint_research_contract(rel_path: str, text: str) -> List[LintError]:
                     )
                 )
 
-        if re.search(
-            r"^\s*根拠リンク:", block, re.MULTILINE
-        ) is not None and not has_candidate_evidence_url(block):
+        if (
+            "根拠リンク:" in block
+            and _RESEARCH_CANDIDATE_LABEL_RES["根拠リンク:"].search(block) is not None
+            and not has_candidate_evidence_url(block)
+        ):
             errs.append(
                 LintError(
                     path=rel_path,
@@ -615,7 +717,7 @@ def lint_research_contract(rel_path: str, text: str) -> List[LintError]:
                 )
             )
 
-    if (not is_template) and re.search(r":\s*Yes\s*/\s*No\s*$", novelty, re.MULTILINE):
+    if (not is_template) and _RESEARCH_NOVELTY_UNFILLED_RE.search(novelty):
         errs.append(
             LintError(
                 path=rel_path,
@@ -626,15 +728,9 @@ def lint_research_contract(rel_path: str, text: str) -> List[LintError]:
         )
 
     if (not is_template) and novelty.strip():
+        answered = [m.group(1) for m in _RESEARCH_NOVELTY_ANSWER_RE.finditer(novelty)]
         for s in _RESEARCH_NOVELTY_REQUIRED_TRIGGER_SUBSTRINGS:
-            if (
-                re.search(
-                    rf"^\s*-\s*.*{re.escape(s)}.*:\s*(Yes|No)\s*$",
-                    novelty,
-                    re.MULTILINE,
-                )
-                is None
-            ):
+            if not any(s in item for item in answered):
                 errs.append(
                     LintError(
                         path=rel_path,
@@ -647,8 +743,8 @@ def lint_research_contract(rel_path: str, text: str) -> List[LintError]:
 
     adjacent_section = extract_h2_section(contract_text, _RESEARCH_ADJACENT_H2_RE)
     has_adjacent_na = (
-        re.search(r"^\s*隣接領域探索\s*:\s*N/A", adjacent_section, re.MULTILINE)
-        is not None
+        "N/A" in adjacent_section
+        and _RESEARCH_ADJACENT_NA_RE.search(adjacent_section) is not None
     )
     adjacent_required = (
         is_research_adjacent_exploration_required(contract_text)
@@ -718,10 +814,12 @@ def lint_research_contract(rel_path: str, text: str) -> List[LintError]:
     return errs
 
 
-def lint_placeholders(_repo: str, rel_path: str, text: str) -> List[LintError]:
+def lint_placeholders(
+    _repo: str, rel_path: str, text: str, approved: bool
+) -> List[LintError]:
     errs: List[LintError] = []
-    if is_approved_prd_or_epic(rel_path, text):
-        scrubbed = strip_inline_code_spans(strip_fenced_code_blocks(text))
+    if approved:
+        scrubbed = _link_scan_text(text)
         if "<!--" in scrubbed and not _ALLOW_HTML_COMMENTS_RE.search(scrubbed):
             errs.append(
                 LintError(
@@ -735,13 +833,15 @@ def lint_placeholders(_repo: str, rel_path: str, text: str) -> List[LintError]:
     return errs
 
 
-def lint_sot_reference_contract(repo: str, rel_path: str, text: str) -> List[LintError]:
+def lint_sot_reference_contract(
+    repo: str, rel_path: str, text: str, approved: bool
+) -> List[LintError]:
     if not rel_path.startswith("docs/epics/"):
         return []
-    if not is_approved_prd_or_epic(rel_path, text):
+    if not approved:
         return []
 
-    contract_text = sanitize_status_text(text)
+    contract_text = _status_text(text)
     refs = list(_SOT_REFERENCE_PRD_LINE_RE.finditer(contract_text))
 
     if len(refs) == 0:
@@ -799,6 +899,9 @@ def lint_sot_reference_contract(repo: str, rel_path: str, text: str) -> List[Lin
 
 _MD_LINK_RE = re.compile(r"\[[^\]]*\]\(([^)]+)\)")
 _MD_REF_DEF_RE = re.compile(r"^[ \t]{0,3}\[[^\]]+\]:\s*(\S+)", re.MULTILINE)
+# A whole backtick run, plus everything up to the next copy of that run when
+# one exists (group 2).  Without a closer only the run itself matches.
+_INLINE_CODE_SPAN_RE = re.compile(r"(`+)(?!`)(?:.*?(\1))?", re.DOTALL)
 
 
 def strip_inline_code_spans(text: str) -> str:
@@ -812,35 +915,16 @@ def strip_inline_code_spans(text: str) -> str:
     and placeholder detection — precise escaped-backtick handling
     is unnecessary for that purpose.
     """
-    out: List[str] = []
-    i = 0
-    n = len(text)
-    while i < n:
-        ch = text[i]
-        if ch != "`":
-            out.append(ch)
-            i += 1
-            continue
-
-        j = i
-        while j < n and text[j] == "`":
-            j += 1
-        delim = text[i:j]
-
-        k = text.find(delim, j)
-        if k == -1:
-            out.append(delim)
-            i = j
-            continue
-
-        i = k + len(delim)
-
-    return "".join(out)
+    if "`" not in text:
+        return text
+    return _INLINE_CODE_SPAN_RE.sub(
+        lambda m: "" if m.group(2) is not None else m.group(1), text
+    )
 
 
 def parse_md_link_targets(text: str) -> List[str]:
     out: List[str] = []
-    scrubbed = strip_inline_code_spans(strip_fenced_code_blocks(text))
+    scrubbed = _link_scan_text(text)
     for m in _MD_LINK_RE.finditer(scrubbed):
         target = (m.group(1) or "").strip()
         if not target:
@@ -882,6 +966,14 @@ def normalize_target(target: str) -> str:
 
 
 def resolve_to_repo_relative(repo: str, file_abs: str, target: str) -> Optional[str]:
+    return _resolve_from_dir(repo, os.path.dirname(file_abs), target)
+
+
+# Sibling docs link the same targets over and over; keyed on the linking
+# directory, resolution and existence checks are shared across files.
+# lint_paths clears both caches so each run sees the current tree.
+@functools.lru_cache(maxsize=16384)
+def _resolve_from_dir(repo: str, file_dir: str, target: str) -> Optional[str]:
     t = normalize_target(target)
     if not t:
         return None
@@ -889,7 +981,6 @@ def resolve_to_repo_relative(repo: str, file_abs: str, target: str) -> Optional[
     if t.startswith("/"):
         abs_candidate = os.path.realpath(os.path.join(repo, t[1:]))
     else:
-        file_dir = os.path.dirname(file_abs)
         abs_candidate = os.path.realpath(os.path.join(file_dir, t))
     repo_abs = os.path.realpath(repo)
     if not abs_candidate.startswith(repo_abs + os.sep) and abs_candidate != repo_abs:
@@ -899,14 +990,26 @@ def resolve_to_repo_relative(repo: str, file_abs: str, target: str) -> Optional[
     return rel
 
 
+@functools.lru_cache(maxsize=16384)
+def _path_exists(path: str) -> bool:
+    return os.path.exists(path)
+
+
 def lint_relative_links(repo: str, rel_path: str, text: str) -> List[LintError]:
     errs: List[LintError] = []
 
     file_abs = os.path.join(repo, rel_path)
+    # A target linked several times in one file is resolved and stat'd once;
+    # every occurrence still reports its own error.
+    checked: Dict[str, Tuple[Optional[str], bool]] = {}
     for raw in parse_md_link_targets(text):
         if is_external_or_fragment(raw):
             continue
-        rel = resolve_to_repo_relative(repo, file_abs, raw)
+        if raw not in checked:
+            rel = resolve_to_repo_relative(repo, file_abs, raw)
+            exists = _path_exists(os.path.join(repo, rel)) if rel else False
+            checked[raw] = (rel, exists)
+        rel, exists = checked[raw]
         if not rel:
             errs.append(
                 LintError(
@@ -915,7 +1018,7 @@ def lint_relative_links(repo: str, rel_path: str, text: str) -> List[LintError]:
                 )
             )
             continue
-        if not os.path.exists(os.path.join(repo, rel)):
+        if not exists:
             errs.append(
                 LintError(
                     path=rel_path,
@@ -926,6 +1029,8 @@ def lint_relative_links(repo: str, rel_path: str, text: str) -> List[LintError]:
 
 
 def lint_paths(repo: str, roots: List[str]) -> List[LintError]:
+    _resolve_from_dir.cache_clear()
+    _path_exists.cache_clear()
     errs: List[LintError] = []
     for root in roots:
         if not is_safe_repo_relative_root(root):
@@ -952,10 +1057,11 @@ def lint_paths(repo: str, roots: List[str]) -> List[LintError]:
         for path_abs in iter_markdown_files(root_abs):
             rel_path = os.path.relpath(path_abs, repo).replace(os.sep, "/")
             text = read_text(path_abs)
-            errs.extend(lint_placeholders(repo, rel_path, text))
+            approved = is_approved_prd_or_epic(rel_path, text)
+            errs.extend(lint_placeholders(repo, rel_path, text, approved))
             errs.extend(lint_status_format(rel_path, text))
             errs.extend(lint_research_contract(rel_path, text))
-            errs.extend(lint_sot_reference_contract(repo, rel_path, text))
+            errs.extend(lint_sot_reference_contract(repo, rel_path, text, approved))
             errs.extend(lint_relative_links(repo, rel_path, text))
     return errs
 
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 
 import argparse
+import functools
 import json
 import os
 import re
@@ -8,10 +9,15 @@ import shutil
 import subprocess
 import sys
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
+from gh_cache import GH_CACHE_TTL_SECONDS, cached_gh_fetch
+from repo_root_cache import cached_repo_root
 from sot_refs import find_issue_ref, resolve_ref_to_repo_path
 
+_ISSUE_BRANCH_RE = re.compile(r"\bissue-(\d+)\b")
+_SCOPE_UNSAFE_RE = re.compile(r"[^A-Za-z0-9._-]+")
+
 
 def eprint(msg: str) -> None:
     print(msg, file=sys.stderr)
@@ -26,10 +32,12 @@ def run(
     cmd: List[str],
     cwd: Optional[str] = None,
     check: bool = True,
+    input: Optional[str] = None,
 ) -> subprocess.CompletedProcess[str]:
     return subprocess.run(  # noqa: S603
         cmd,
         cwd=cwd,
+        input=input,
         text=True,
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
@@ -37,8 +45,33 @@ def run(
     )
 
 
-def git_repo_root() -> str:
-    git_bin = shutil.which("git")
+def run_bytes(
+    cmd: List[str],
+    cwd: Optional[str] = None,
+    check: bool = True,
+) -> subprocess.CompletedProcess[bytes]:
+    # For large outputs (diffs) that are written out unchanged.
+    return subprocess.run(  # noqa: S603
+        cmd,
+        cwd=cwd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        check=check,
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _git_bin() -> Optional[str]:
+    return shutil.which("git")
+
+
+@functools.lru_cache(maxsize=1)
+def _gh_bin() -> Optional[str]:
+    return shutil.which("gh")
+
+
+def _git_toplevel() -> str:
+    git_bin = _git_bin()
     if not git_bin:
         raise RuntimeError("git not found on PATH")
     try:
@@ -51,8 +84,15 @@ def git_repo_root() -> str:
     return os.path.realpath(root)
 
 
+def git_repo_root() -> str:
+    root = cached_repo_root(_git_toplevel)
+    if not root:
+        raise RuntimeError("Failed to locate repo root via git.")
+    return root
+
+
 def current_branch(repo_root: str) -> str:
-    git_bin = shutil.which("git")
+    git_bin = _git_bin()
     if not git_bin:
         return ""
     try:
@@ -63,7 +103,7 @@ def current_branch(repo_root: str) -> str:
 
 
 def extract_issue_number_from_branch(branch: str) -> Optional[str]:
-    m = re.search(r"\bissue-(\d+)\b", branch)
+    m = _ISSUE_BRANCH_RE.search(branch)
     if not m:
         return None
     return m.group(1)
@@ -93,11 +133,47 @@ def parse_issue_body_for_refs(body: str) -> Tuple[str, str]:
     return prd_ref.strip(), epic_ref.strip()
 
 
+def gh_issue_view(repo_root: str, issue_number: str, gh_repo: str) -> Tuple[str, str]:
+    # Returns: body, url
+    cmd = ["gh"]
+    if gh_repo:
+        cmd += ["-R", gh_repo]
+    cmd += ["issue", "view", issue_number, "--json", "body,url"]
+    try:
+        p = run(cmd, cwd=repo_root, check=True)
+    except subprocess.CalledProcessError as exc:
+        msg = exc.stderr.strip() or exc.stdout.strip() or str(exc)
+        raise RuntimeError(f"Failed to fetch Issue via gh: {msg}")
+
+    try:
+        data = json.loads(p.stdout)
+    except Exception as exc:  # noqa: BLE001
+        raise RuntimeError(f"Invalid JSON from gh issue view: {exc}")
+
+    return str(data.get("body") or ""), str(data.get("url") or "")
+
+
+def cached_gh_issue_view(
+    repo_root: str, issue_number: str, gh_repo: str
+) -> Tuple[str, str]:
+    """gh_issue_view with a short-lived on-disk cache (GH_CACHE_TTL_SECONDS)."""
+
+    def fetch() -> Dict[str, str]:
+        body, url = gh_issue_view(repo_root, issue_number, gh_repo)
+        return {"body": body, "url": url}
+
+    # Without -R, gh picks the repo from repo_root, so it is part of the key.
+    scope = gh_repo or f"cwd:{repo_root}"
+    data = cached_gh_fetch("gh-issue-view", scope, issue_number, ("body", "url"), fetch)
+    return data["body"], data["url"]
+
+
 def resolve_issue_refs(
     repo_root: str,
     issue_number: Optional[str],
     gh_repo: str,
     issue_body_file: str,
+    no_cache: bool = False,
 ) -> Tuple[str, str, Optional[str]]:
     # Returns: prd_path, epic_path, issue_url
     if issue_body_file:
@@ -112,23 +188,10 @@ def resolve_issue_refs(
             "Issue number is required when GH_ISSUE_BODY_FILE is not set."
         )
 
-    cmd = ["gh"]
-    if gh_repo:
-        cmd += ["-R", gh_repo]
-    cmd += ["issue", "view", issue_number, "--json", "body,url"]
-    try:
-        p = run(cmd, cwd=repo_root, check=True)
-    except subprocess.CalledProcessError as exc:
-        msg = exc.stderr.strip() or exc.stdout.strip() or str(exc)
-        raise RuntimeError(f"Failed to fetch Issue via gh: {msg}")
-
-    try:
-        data = json.loads(p.stdout)
-    except Exception as exc:  # noqa: BLE001
-        raise RuntimeError(f"Invalid JSON from gh issue view: {exc}")
-
-    body = str(data.get("body") or "")
-    issue_url = str(data.get("url") or "")
+    if no_cache:
+        body, issue_url = gh_issue_view(repo_root, issue_number, gh_repo)
+    else:
+        body, issue_url = cached_gh_issue_view(repo_root, issue_number, gh_repo)
 
     prd_ref, epic_ref = parse_issue_body_for_refs(body)
     prd_path = resolve_ref_to_repo_path(repo_root, prd_ref)
@@ -136,40 +199,78 @@ def resolve_issue_refs(
     return prd_path, epic_path, issue_url or None
 
 
+_PRD_REF_LINE_RE = re.compile(r"参照PRD\s*:\s*(.+)$")
+
+
+def iter_markdown_files(root: str) -> Iterator[str]:
+    """Yield *.md paths under root in the same order as os.walk(root)."""
+    try:
+        with os.scandir(root) as it:
+            entries = list(it)
+    except OSError:
+        return
+    subdirs: List[str] = []
+    for entry in entries:
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            is_dir = False
+        if is_dir:
+            if not entry.is_symlink():
+                subdirs.append(entry.path)
+        elif entry.name.endswith(".md"):
+            yield entry.path
+    for path in subdirs:
+        yield from iter_markdown_files(path)
+
+
+def epic_references_prd(
+    repo_root: str,
+    epic_abs: str,
+    prd_path: str,
+    resolved_refs: Optional[Dict[str, Optional[str]]] = None,
+) -> bool:
+    # One substring scan rejects most Epics before any per-line work.
+    with open(epic_abs, "rb") as fh:
+        text = fh.read().decode("utf-8")
+    if "参照PRD" not in text:
+        return False
+    # splitlines() also breaks on \r, \x0b, \x85, U+2028 and friends.
+    for line in text.splitlines():
+        if "参照PRD" not in line:
+            continue
+        m = _PRD_REF_LINE_RE.search(line)
+        if not m:
+            continue
+        ref = m.group(1).strip()
+        if is_placeholder_ref(ref):
+            continue
+        # Epics often share the same 参照PRD text; resolve it once per scan.
+        if resolved_refs is not None and ref in resolved_refs:
+            resolved = resolved_refs[ref]
+        else:
+            try:
+                resolved = resolve_ref_to_repo_path(repo_root, ref)
+            except ValueError:
+                resolved = None
+            if resolved_refs is not None:
+                resolved_refs[ref] = resolved
+        if resolved == prd_path:
+            return True
+    return False
+
+
 def find_epic_by_prd(repo_root: str, prd_path: str) -> str:
     epics_root = os.path.join(repo_root, "docs", "epics")
     candidates: List[str] = []
+    resolved_refs: Dict[str, Optional[str]] = {}
 
     if not os.path.isdir(epics_root):
         raise RuntimeError("docs/epics/ not found; cannot auto-resolve Epic.")
 
-    for root, _dirs, files in os.walk(epics_root):
-        for name in files:
-            if not name.endswith(".md"):
-                continue
-            rel = os.path.relpath(os.path.join(root, name), repo_root).replace(
-                os.sep, "/"
-            )
-            text = read_text(os.path.join(repo_root, rel))
-            for line in text.splitlines():
-                if "参照PRD" not in line:
-                    continue
-                m = re.search(r"参照PRD\s*:\s*(.+)$", line)
-                if not m:
-                    continue
-                ref = m.group(1).strip()
-                if is_placeholder_ref(ref):
-                    continue
-                resolved = None
-                try:
-                    resolved = resolve_ref_to_repo_path(repo_root, ref)
-                except ValueError:
-                    resolved = None
-                if resolved is None:
-                    continue
-                if resolved == prd_path:
-                    candidates.append(rel)
-                    break
+    for epic_abs in iter_markdown_files(epics_root):
+        if epic_references_prd(repo_root, epic_abs, prd_path, resolved_refs):
+            candidates.append(os.path.relpath(epic_abs, repo_root).replace(os.sep, "/"))
 
     if len(candidates) == 1:
         return candidates[0]
@@ -179,7 +280,7 @@ def find_epic_by_prd(repo_root: str, prd_path: str) -> str:
         )
     raise RuntimeError(
         "Multiple Epics reference the same PRD; specify --epic explicitly: "
-        + ", ".join(candidates)
+        + ", ".join(sorted(candidates))
     )
 
 
@@ -190,9 +291,10 @@ def ensure_file_exists(repo_root: str, rel_path: str, label: str) -> None:
 
 
 def detect_pr_number(repo_root: str, gh_repo: str) -> Optional[str]:
-    if not shutil_which("gh"):
+    gh_bin = _gh_bin()
+    if not gh_bin:
         return None
-    cmd = ["gh"]
+    cmd = [gh_bin]
     if gh_repo:
         cmd += ["-R", gh_repo]
     cmd += ["pr", "view", "--json", "number"]
@@ -210,45 +312,47 @@ def detect_pr_number(repo_root: str, gh_repo: str) -> Optional[str]:
     return None
 
 
-def shutil_which(cmd: str) -> Optional[str]:
-    path = os.environ.get("PATH", "")
-    for d in path.split(os.pathsep):
-        p = os.path.join(d, cmd)
-        if os.path.isfile(p) and os.access(p, os.X_OK):
-            return p
-    return None
-
-
-def git_has_diff(repo_root: str, args: List[str]) -> bool:
-    git_bin = shutil.which("git")
+def git_has_diffs(repo_root: str, args_list: List[List[str]]) -> List[bool]:
+    """Run `git diff --quiet` per args list concurrently; True where it differs."""
+    git_bin = _git_bin()
     if not git_bin:
         raise RuntimeError("git not found on PATH")
-    cp = run(
-        [git_bin, "diff", "--quiet"] + args,
-        cwd=repo_root,
-        check=False,
-    )
-    return cp.returncode != 0
+    procs = [
+        subprocess.Popen(  # noqa: S603
+            [git_bin, "diff", "--quiet"] + args,
+            cwd=repo_root,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        for args in args_list
+    ]
+    return [p.wait() != 0 for p in procs]
 
 
-def git_diff_text(repo_root: str, args: List[str]) -> str:
-    git_bin = shutil.which("git")
+def git_diff_bytes(repo_root: str, args: List[str]) -> bytes:
+    git_bin = _git_bin()
     if not git_bin:
         raise RuntimeError("git not found on PATH")
-    p = run([git_bin, "diff", "--no-color"] + args, cwd=repo_root, check=True)
+    p = run_bytes([git_bin, "diff", "--no-color"] + args, cwd=repo_root, check=True)
     return p.stdout
 
 
-def git_ref_exists(repo_root: str, ref: str) -> bool:
-    git_bin = shutil.which("git")
-    if not git_bin:
-        return False
+def git_refs_exist(repo_root: str, refs: List[str]) -> List[bool]:
+    """Resolve all refs with a single `git cat-file --batch-check` process."""
+    git_bin = _git_bin()
+    if not git_bin or any("\n" in ref for ref in refs):
+        return [False] * len(refs)
     cp = run(
-        [git_bin, "rev-parse", "--verify", ref],
+        [git_bin, "cat-file", "--batch-check=%(objectname)"],
         cwd=repo_root,
         check=False,
+        input="".join(f"{ref}\n" for ref in refs),
     )
-    return cp.returncode == 0
+    lines = cp.stdout.splitlines()
+    if cp.returncode != 0 or len(lines) != len(refs):
+        return [False] * len(refs)
+    # Found objects print their bare object name; misses print "<ref> missing".
+    return [" " not in line for line in lines]
 
 
 def resolve_diff(
@@ -257,39 +361,43 @@ def resolve_diff(
     pr_number: Optional[str],
     diff_mode: str,
     base_ref: str,
-) -> Tuple[str, str, Optional[str]]:
-    # Returns: diff_source, diff_text, detail
+) -> Tuple[str, bytes, Optional[str]]:
+    # Returns: diff_source, diff (raw git/gh output), detail
     # detail: base ref for range or pr number for pr
     if diff_mode == "pr":
         if not pr_number:
             raise RuntimeError("diff_mode=pr requires a PR number.")
-        if not shutil_which("gh"):
+        gh_bin = _gh_bin()
+        if not gh_bin:
             raise RuntimeError("gh is required for PR diff but was not found on PATH.")
-        cmd = ["gh"]
+        cmd = [gh_bin]
         if gh_repo:
             cmd += ["-R", gh_repo]
         cmd += ["pr", "diff", pr_number, "--patch"]
         try:
-            p = run(cmd, cwd=repo_root, check=True)
+            p = run_bytes(cmd, cwd=repo_root, check=True)
         except subprocess.CalledProcessError as exc:
-            msg = exc.stderr.strip() or exc.stdout.strip() or str(exc)
+            msg = (
+                exc.stderr.decode("utf-8", "replace").strip()
+                or exc.stdout.decode("utf-8", "replace").strip()
+                or str(exc)
+            )
             raise RuntimeError(f"Failed to fetch PR diff via gh: {msg}")
         if not p.stdout.strip():
             raise RuntimeError("PR diff is empty.")
         return "pr", p.stdout, pr_number
 
-    has_staged = git_has_diff(repo_root, ["--cached"])
-    has_worktree = git_has_diff(repo_root, [])
+    has_staged, has_worktree = git_has_diffs(repo_root, [["--cached"], []])
 
     if diff_mode == "staged":
         if not has_staged:
             raise RuntimeError("Diff is empty (staged).")
-        return "staged", git_diff_text(repo_root, ["--cached"]), None
+        return "staged", git_diff_bytes(repo_root, ["--cached"]), None
 
     if diff_mode == "worktree":
         if not has_worktree:
             raise RuntimeError("Diff is empty (worktree).")
-        return "worktree", git_diff_text(repo_root, []), None
+        return "worktree", git_diff_bytes(repo_root, []), None
 
     if diff_mode == "auto" or diff_mode == "":
         if has_staged and has_worktree:
@@ -297,9 +405,9 @@ def resolve_diff(
                 "Both staged and worktree diffs are non-empty. Set --diff-mode staged or worktree."
             )
         if has_staged:
-            return "staged", git_diff_text(repo_root, ["--cached"]), None
+            return "staged", git_diff_bytes(repo_root, ["--cached"]), None
         if has_worktree:
-            return "worktree", git_diff_text(repo_root, []), None
+            return "worktree", git_diff_bytes(repo_root, []), None
         # Fallback: range diff
         diff_mode = "range"
 
@@ -307,13 +415,15 @@ def resolve_diff(
         raise RuntimeError("Invalid diff mode (use auto|staged|worktree|range|pr).")
 
     base = base_ref
-    if not git_ref_exists(repo_root, base):
-        if base == "origin/main" and git_ref_exists(repo_root, "main"):
+    candidates = [base, "main"] if base == "origin/main" else [base]
+    found = git_refs_exist(repo_root, candidates)
+    if not found[0]:
+        if len(found) > 1 and found[1]:
             base = "main"
         else:
             raise RuntimeError(f"Base ref not found for range diff: {base}")
 
-    text = git_diff_text(repo_root, [f"{base}...HEAD"])
+    text = git_diff_bytes(repo_root, [f"{base}...HEAD"])
     if not text.strip():
         raise RuntimeError(f"Diff is empty (range: {base}...HEAD).")
     return "range", text, base
@@ -347,6 +457,11 @@ def main() -> int:
     )
     parser.add_argument("--run-id", default="", help="Run id (default: timestamp)")
     parser.add_argument("--dry-run", action="store_true", help="Do not write files")
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Always call gh (default: reuse an Issue fetched in the last {GH_CACHE_TTL_SECONDS}s)",
+    )
     args = parser.parse_args()
 
     try:
@@ -392,6 +507,7 @@ def main() -> int:
                     issue_number=issue_number or None,
                     gh_repo=gh_repo,
                     issue_body_file=issue_body_file,
+                    no_cache=args.no_cache,
                 )
                 issue_url = url
                 if not prd_path:
@@ -402,10 +518,15 @@ def main() -> int:
         if not prd_path:
             prd_root = os.path.join(repo_root, "docs", "prd")
             prds = []
-            if os.path.isdir(prd_root):
-                for name in os.listdir(prd_root):
-                    if name.endswith(".md"):
-                        prds.append(f"docs/prd/{name}")
+            try:
+                with os.scandir(prd_root) as it:
+                    prds = [
+                        f"docs/prd/{entry.name}"
+                        for entry in it
+                        if entry.name.endswith(".md")
+                    ]
+            except (FileNotFoundError, NotADirectoryError):
+                pass
             if len(prds) == 1:
                 prd_path = prds[0]
             elif len(prds) == 0:
@@ -424,7 +545,7 @@ def main() -> int:
         ensure_file_exists(repo_root, prd_path, "PRD")
         ensure_file_exists(repo_root, epic_path, "Epic")
 
-        diff_source, diff_text, diff_detail = resolve_diff(
+        diff_source, diff_bytes, diff_detail = resolve_diff(
             repo_root=repo_root,
             gh_repo=gh_repo,
             pr_number=pr_number,
@@ -439,7 +560,7 @@ def main() -> int:
             scope_id = f"pr-{pr_number}"
         else:
             b = current_branch(repo_root) or "unknown"
-            safe = re.sub(r"[^A-Za-z0-9._-]+", "_", b).strip("_")
+            safe = _SCOPE_UNSAFE_RE.sub("_", b).strip("_")
             scope_id = f"branch-{safe or 'unknown'}"
 
         run_id = args.run_id.strip() if args.run_id else ""
@@ -470,18 +591,18 @@ def main() -> int:
             "inputs_path": os.path.relpath(out_json, repo_root).replace(os.sep, "/"),
         }
 
+        # Serialized once; inputs.json and stdout carry the same document.
+        payload = json.dumps(out, ensure_ascii=True, indent=2) + "\n"
         if not args.dry_run:
             os.makedirs(out_dir, exist_ok=True)
-            with open(out_diff, "w", encoding="utf-8") as fh:
-                fh.write(diff_text)
-                if not diff_text.endswith("\n"):
-                    fh.write("\n")
+            with open(out_diff, "wb") as fh:
+                fh.write(diff_bytes)
+                if not diff_bytes.endswith(b"\n"):
+                    fh.write(b"\n")
             with open(out_json, "w", encoding="utf-8") as fh:
-                json.dump(out, fh, ensure_ascii=True, indent=2)
-                fh.write("\n")
+                fh.write(payload)
 
-        json.dump(out, sys.stdout, ensure_ascii=True, indent=2)
-        sys.stdout.write("\n")
+        sys.stdout.write(payload)
         return 0
     except Exception as exc:  # noqa: BLE001
         eprint(str(exc))
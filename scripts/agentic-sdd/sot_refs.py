@@ -2,9 +2,13 @@
 
 import os
 import re
-from typing import Optional
+from typing import Dict, Optional
 from urllib.parse import urlparse
 
+_MD_LINK_RE = re.compile(r"\[[^\]]*\]\(([^)]+)\)")
+# find_issue_ref patterns, compiled once per key ("PRD", "Epic", ...)
+_ISSUE_REF_RES: Dict[str, re.Pattern[str]] = {}
+
 
 def is_safe_repo_relative(path: str) -> bool:
     if not path:
@@ -23,7 +27,7 @@ def normalize_reference(ref: str) -> str:
     ref = ref.strip()
 
     # Markdown link: [text](target)
-    m = re.search(r"\[[^\]]*\]\(([^)]+)\)", ref)
+    m = _MD_LINK_RE.search(ref)
     if m:
         ref = m.group(1).strip()
 
@@ -105,11 +109,16 @@ def resolve_ref_to_repo_path(repo_root: str, ref: str) -> str:
 
 def find_issue_ref(body: str, key: str) -> Optional[str]:
     # Matches: - Epic: ... / - PRD: ...
-    pattern = re.compile(rf"^\s*[-*]\s*{re.escape(key)}\s*:\s*(.+?)\s*$", re.IGNORECASE)
-    for line in body.splitlines():
-        m = pattern.match(line)
-        if not m:
-            continue
-        val = m.group(1).strip()
-        return val
-    return None
+    pattern = _ISSUE_REF_RES.get(key)
+    if pattern is None:
+        # [^\S\n] keeps each match on one line, like matching line by line.
+        pattern = re.compile(
+            rf"^[^\S\n]*[-*][^\S\n]*{re.escape(key)}[^\S\n]*:[^\S\n]*(.+?)[^\S\n]*$",
+            re.IGNORECASE | re.MULTILINE,
+        )
+        _ISSUE_REF_RES[key] = pattern
+    # Re-join so every splitlines() boundary becomes a plain "\n".
+    m = pattern.search("\n".join(body.splitlines()))
+    if not m:
+        return None
+    return m.group(1).strip()
@@ -10,6 +10,9 @@ tmpdir="$(mktemp -d 2>/dev/null || mktemp -d -t agentic-sdd-approval-gate)"
 cleanup() { rm -rf "$tmpdir"; }
 trap cleanup EXIT
 
+# Keep script caches (repo root, gh issues, validation stamps) out of ~/.cache
+export XDG_CACHE_HOME="$tmpdir/cache"
+
 work="$tmpdir/work"
 wt="$tmpdir/wt"
 remote="$tmpdir/remote.git"
@@ -28,6 +31,7 @@ cp -p "$repo_root/scripts/validate-approval.py" "$work/scripts/validate-approval
 cp -p "$repo_root/scripts/validate-worktree.py" "$work/scripts/validate-worktree.py"
 cp -p "$repo_root/scripts/create-approval.py" "$work/scripts/create-approval.py"
 cp -p "$repo_root/scripts/approval_constants.py" "$work/scripts/approval_constants.py"
+cp -p "$repo_root/scripts/repo_root_cache.py" "$work/scripts/repo_root_cache.py"
 cp -p "$repo_root/.githooks/pre-commit" "$work/.githooks/pre-commit"
 cp -p "$repo_root/.githooks/pre-push" "$work/.githooks/pre-push"
 
@@ -44,6 +48,7 @@ cp -p "$repo_root/scripts/validate-approval.py" "$wt/scripts/validate-approval.p
 cp -p "$repo_root/scripts/validate-worktree.py" "$wt/scripts/validate-worktree.py"
 cp -p "$repo_root/scripts/create-approval.py" "$wt/scripts/create-approval.py"
 cp -p "$repo_root/scripts/approval_constants.py" "$wt/scripts/approval_constants.py"
+cp -p "$repo_root/scripts/repo_root_cache.py" "$wt/scripts/repo_root_cache.py"
 cp -p "$repo_root/.githooks/pre-commit" "$wt/.githooks/pre-commit"
 cp -p "$repo_root/.githooks/pre-push" "$wt/.githooks/pre-push"
 
@@ -141,6 +146,84 @@ fi
 
 assert_invalid_approval_args 0
 
+# Validation stamp: a passing run is recorded and reused until an input changes.
+approval_dir="$wt/.agentic-sdd/approvals/issue-123"
+stamps="$XDG_CACHE_HOME/agentic-sdd/approval-validated.json"
+
+expect_blocked() {
+	local label="$1" pattern="$2"
+	shift 2
+	set +e
+	(cd "$wt" && env "$@" python3 scripts/validate-approval.py >/dev/null 2>"$tmpdir/stderr_stamp")
+	local rc=$?
+	set -e
+	if [[ "$rc" -ne 2 ]] || ! grep -q "$pattern" "$tmpdir/stderr_stamp"; then
+		eprint "FAIL: expected validate-approval.py to block ($label), got rc=$rc"
+		cat "$tmpdir/stderr_stamp" >&2
+		exit 1
+	fi
+}
+
+# Writes the stamp of the current (possibly invalid) records, plus one for a
+# record that no longer exists.
+forge_stamps() {
+	(cd "$wt" && python3 - "$stamps" "$tmpdir/deleted-wt/approval.json" <<'PY'
+import importlib.util
+import json
+import os
+import sys
+
+sys.path.insert(0, "scripts")
+spec = importlib.util.spec_from_file_location(
+    "validate_approval", "scripts/validate-approval.py"
+)
+mod = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(mod)
+approval_json, estimate_md = mod.approval_paths(os.path.realpath("."), 123)
+stamp = mod.validation_stamp(123, approval_json, estimate_md)
+with open(sys.argv[1], "w", encoding="utf-8") as fh:
+    json.dump({os.path.realpath(approval_json): stamp, sys.argv[2]: stamp}, fh)
+PY
+	)
+}
+
+rm -f "$stamps"
+(cd "$wt" && python3 scripts/validate-approval.py >/dev/null)
+if [[ ! -s "$stamps" ]]; then
+	eprint "FAIL: expected a validation stamp after a passing run"
+	exit 1
+fi
+(cd "$wt" && python3 scripts/validate-approval.py >/dev/null)
+
+cp "$approval_dir/estimate.md" "$tmpdir/estimate.md.bak"
+cp "$approval_dir/approval.json" "$tmpdir/approval.json.bak"
+
+echo "edited after approval" >>"$approval_dir/estimate.md"
+expect_blocked "estimate.md edited after a pass" "Estimate drift detected"
+cp "$tmpdir/estimate.md.bak" "$approval_dir/estimate.md"
+(cd "$wt" && python3 scripts/validate-approval.py >/dev/null)
+
+sed -i.bak 's/"mode": "impl"/"mode": "bogus"/' "$approval_dir/approval.json"
+expect_blocked "approval.json edited after a pass" "mode must be one of"
+cp "$tmpdir/approval.json.bak" "$approval_dir/approval.json"
+rm -f "$approval_dir/approval.json.bak"
+
+# A stamp that matches the current files is trusted as-is; the opt-out
+# variable forces a full re-validation.
+echo "edited after approval" >>"$approval_dir/estimate.md"
+forge_stamps
+(cd "$wt" && python3 scripts/validate-approval.py >/dev/null)
+expect_blocked "AGENTIC_SDD_NO_VALIDATE_CACHE=1" "Estimate drift detected" AGENTIC_SDD_NO_VALIDATE_CACHE=1
+cp "$tmpdir/estimate.md.bak" "$approval_dir/estimate.md"
+
+# Re-validating after the change records a fresh stamp and drops the stamp
+# of the deleted record.
+(cd "$wt" && python3 scripts/validate-approval.py >/dev/null)
+if grep -q "deleted-wt" "$stamps"; then
+	eprint "FAIL: expected the stamp of a deleted approval record to be pruned"
+	exit 1
+fi
+
 git -C "$wt" push -q
 
 printf '%s\n' "OK: approval gate smoke test passed"
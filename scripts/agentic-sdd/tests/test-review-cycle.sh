@@ -40,6 +40,9 @@ tmpdir="$(mktemp -d 2>/dev/null || mktemp -d -t agentic-sdd-review-cycle)"
 cleanup() { rm -rf "$tmpdir"; }
 trap cleanup EXIT
 
+# Keep script caches (repo root, gh issues, validation stamps) out of ~/.cache
+export XDG_CACHE_HOME="$tmpdir/cache"
+
 git -C "$tmpdir" init -q
 mkdir -p "$tmpdir/.agent/schemas"
 cp -p "$schema_src" "$tmpdir/.agent/schemas/review.json"
@@ -22,11 +22,16 @@ tmpdir="$(mktemp -d 2>/dev/null || mktemp -d -t agentic-sdd-sync-docs-test)"
 cleanup() { rm -rf "$tmpdir"; }
 trap cleanup EXIT
 
+# Keep script caches (repo root, gh issues, validation stamps) out of ~/.cache
+export XDG_CACHE_HOME="$tmpdir/cache"
+
 git -C "$tmpdir" init -q
 
 mkdir -p "$tmpdir/scripts"
 cp -p "$resolver_py_src" "$tmpdir/scripts/resolve-sync-docs-inputs.py"
 cp -p "$sot_refs_src" "$tmpdir/scripts/sot_refs.py"
+cp -p "$repo_root/scripts/repo_root_cache.py" "$tmpdir/scripts/repo_root_cache.py"
+cp -p "$repo_root/scripts/gh_cache.py" "$tmpdir/scripts/gh_cache.py"
 chmod +x "$tmpdir/scripts/resolve-sync-docs-inputs.py"
 
 # Minimal repo content
@@ -23,11 +23,15 @@ tmpdir="$(mktemp -d 2>/dev/null || mktemp -d -t agentic-sdd-worktree-test)"
 cleanup() { rm -rf "$tmpdir"; }
 trap cleanup EXIT
 
+# Keep script caches (repo root, gh issues, validation stamps) out of ~/.cache
+export XDG_CACHE_HOME="$tmpdir/cache"
+
 git -C "$tmpdir" init -q
 
 mkdir -p "$tmpdir/scripts"
 cp -p "$worktree_sh_src" "$tmpdir/scripts/worktree.sh"
 cp -p "$extractor_src" "$tmpdir/scripts/extract-issue-files.py"
+cp -p "$repo_root/scripts/gh_cache.py" "$tmpdir/scripts/gh_cache.py"
 chmod +x "$tmpdir/scripts/worktree.sh"
 
 # Stub gh for deterministic tests (no network/auth)
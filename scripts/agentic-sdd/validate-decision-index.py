@@ -7,16 +7,27 @@ Checks:
   AC3: Supersedes references point to existing Decision-IDs.
 
 Usage:
-  python3 scripts/validate-decision-index.py [<repo-root>]
+  python3 scripts/validate-decision-index.py [--no-cache] [--jobs N] [<repo-root>]
 
-Defaults to current working directory as repo root.
+Defaults to current working directory as repo root.  Parsed body files are
+cached by content hash under $XDG_CACHE_HOME/agentic-sdd/decision-validate/
+(default ~/.cache), so nothing is written into the worktree.
 """
 
 from __future__ import annotations
 
+import argparse
+import hashlib
+import json
+import os
 import re
 import sys
+from collections import Counter
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path, PurePosixPath
+from typing import TypeGuard
 
 # Required sections in every decision body (from _template.md / README.md)
 REQUIRED_SECTIONS: list[str] = [
@@ -29,10 +40,17 @@ REQUIRED_SECTIONS: list[str] = [
     "Supersedes",
     "Inputs Fingerprint",
 ]
+REQUIRED_SET: frozenset[str] = frozenset(REQUIRED_SECTIONS)
 
 # Files to skip in the decisions directory
 SKIP_FILES: set[str] = {"_template.md", "README.md"}
 
+# Repo-relative prefix of decision body files
+_DECISIONS_PREFIX = "docs/decisions/"
+
+# Bump whenever parse_body output changes so stale cache entries are ignored
+CACHE_VERSION = 2
+
 # Pattern matching Decision-ID values (D-YYYY-MM-DD-UPPER_SNAKE)
 DECISION_ID_RE = re.compile(r"D-\d{4}-\d{2}-\d{2}-[A-Z][A-Z0-9_]*")
 
@@ -40,19 +58,28 @@ INDEX_ENTRY_RE = re.compile(
     r"^-\s+(D-\d{4}-\d{2}-\d{2}-[A-Z][A-Z0-9_]*):\s+\[`([^`]+)`\]\(([^)]+)\)\s*$"
 )
 
+# Line-level markdown patterns (compiled once; matched per line)
+_FENCE_RE = re.compile(r"^\s*([`~]{3,})")
+_H2_RE = re.compile(r"^##\s+(.+)")
+_H2_ANY_RE = re.compile(r"^##(?!#)\s+")
+_H3PLUS_RE = re.compile(r"^#{3,}\s+")
+_DECISION_ID_H2_RE = re.compile(r"^##\s+Decision-ID")
+_SUPERSEDES_H2_RE = re.compile(r"^##\s+Supersedes")
+_INDEX_HEADER_RE = re.compile(r"^##\s+Decision Index")
+
 
 def eprint(*args: object) -> None:
     print(*args, file=sys.stderr)
 
 
-def iter_non_fenced_lines(text: str) -> list[str]:
-    lines: list[str] = []
+def iter_non_fenced_lines(text: str) -> Iterator[str]:
     in_fence = False
     fence_char = ""
     fence_len = 0
+    fence_re_match = _FENCE_RE.match
 
     for line in text.splitlines():
-        fence_match = re.match(r"^\s*([`~]{3,})", line)
+        fence_match = fence_re_match(line)
         if fence_match:
             marker = fence_match.group(1)
             marker_char = marker[0]
@@ -71,71 +98,152 @@ def iter_non_fenced_lines(text: str) -> list[str]:
         if in_fence:
             continue
 
-        lines.append(line)
+        yield line
 
-    return lines
 
+@dataclass(frozen=True)
+class BodyInfo:
+    sections: set[str]
+    decision_id: str | None
+    supersedes_refs: list[str]
+    supersedes_invalid: list[str]
 
-def find_sections(text: str) -> set[str]:
-    """Extract H2 section names from markdown text."""
-    sections: set[str] = set()
-    for line in iter_non_fenced_lines(text):
-        m = re.match(r"^##\s+(.+)", line)
-        if m:
-            sections.add(m.group(1).strip())
-    return sections
 
+def parse_body(text: str) -> BodyInfo:
+    """Extract H2 sections, Decision-ID and Supersedes entries in one pass.
 
-def extract_decision_id(text: str) -> str | None:
-    """Extract the Decision-ID value from body text."""
-    in_id_section = False
-    for line in iter_non_fenced_lines(text):
-        if re.match(r"^##\s+Decision-ID", line):
-            in_id_section = True
-            continue
-        if in_id_section:
-            stripped = line.strip()
-            if not stripped:
-                continue
-            if stripped.startswith("#"):
-                break
-            if DECISION_ID_RE.fullmatch(stripped):
-                return stripped
-    return None
-
-
-def extract_supersedes(text: str) -> tuple[list[str], list[str]]:
-    """Extract Supersedes Decision-ID references and invalid entries from body text."""
-    in_supersedes = False
+    Scanning stops once every required section has been seen and the
+    Decision-ID and Supersedes sections are finished, so `sections` holds
+    the H2 titles up to that point rather than every title in the file.
+    """
+    sections: set[str] = set()
+    decision_id: str | None = None
     refs: list[str] = []
     invalid_entries: list[str] = []
-    for line in iter_non_fenced_lines(text):
-        if re.match(r"^##\s+Supersedes", line):
-            in_supersedes = True
-            continue
-        if in_supersedes:
-            stripped = line.strip()
-            if stripped.startswith("#"):
-                break
-            if not stripped:
-                continue
-            # Skip N/A
-            if stripped in ("- N/A", "N/A"):
-                continue
-            payload = stripped
-            if payload.startswith("-"):
-                payload = payload[1:].strip()
 
-            tokens = [token.strip() for token in payload.split(",") if token.strip()]
-            if not tokens:
-                invalid_entries.append(stripped)
-                continue
+    in_id_section = False
+    id_done = False
+    in_supersedes = False
+    supersedes_done = False
+    required_done = False
+    h2_match = _H2_RE.match
+    decision_id_fullmatch = DECISION_ID_RE.fullmatch
 
-            if all(DECISION_ID_RE.fullmatch(token) for token in tokens):
-                refs.extend(tokens)
-            else:
-                invalid_entries.append(stripped)
-    return refs, invalid_entries
+    for line in iter_non_fenced_lines(text):
+        m = h2_match(line)
+        if m and not required_done:
+            sections.add(m.group(1).strip())
+            required_done = REQUIRED_SET <= sections
+
+        if not id_done:
+            if m and _DECISION_ID_H2_RE.match(line):
+                in_id_section = True
+            elif in_id_section:
+                stripped = line.strip()
+                if stripped.startswith("#"):
+                    id_done = True
+                elif stripped and decision_id_fullmatch(stripped):
+                    decision_id = stripped
+                    id_done = True
+
+        if not supersedes_done:
+            if m and _SUPERSEDES_H2_RE.match(line):
+                in_supersedes = True
+            elif in_supersedes:
+                stripped = line.strip()
+                if stripped.startswith("#"):
+                    supersedes_done = True
+                # Skip blank lines and N/A
+                elif stripped and stripped not in ("- N/A", "N/A"):
+                    payload = stripped
+                    if payload.startswith("-"):
+                        payload = payload[1:].strip()
+
+                    tokens = [
+                        token for token in map(str.strip, payload.split(",")) if token
+                    ]
+                    # all() stops at the first bad token; valid rows match each token once
+                    if tokens and all(map(decision_id_fullmatch, tokens)):
+                        refs.extend(tokens)
+                    else:
+                        invalid_entries.append(stripped)
+
+        if required_done and id_done and supersedes_done:
+            break
+
+    return BodyInfo(
+        sections=sections,
+        decision_id=decision_id,
+        supersedes_refs=refs,
+        supersedes_invalid=invalid_entries,
+    )
+
+
+def default_cache_dir() -> Path:
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return Path(base) / "agentic-sdd" / "decision-validate"
+
+
+def _is_str_list(value: object) -> TypeGuard[list[str]]:
+    return isinstance(value, list) and all(isinstance(x, str) for x in value)
+
+
+def _body_info_from_cache(cached: object) -> BodyInfo | None:
+    """Rebuild a BodyInfo from a cache entry; None if it is stale or malformed."""
+    if not isinstance(cached, dict) or cached.get("v") != CACHE_VERSION:
+        return None
+    sections = cached.get("sections")
+    decision_id = cached.get("decision_id")
+    supersedes = cached.get("supersedes")
+    invalid = cached.get("invalid")
+    if not (
+        _is_str_list(sections)
+        and (decision_id is None or isinstance(decision_id, str))
+        and _is_str_list(supersedes)
+        and _is_str_list(invalid)
+    ):
+        return None
+    return BodyInfo(
+        sections=set(sections),
+        decision_id=decision_id,
+        supersedes_refs=supersedes,
+        supersedes_invalid=invalid,
+    )
+
+
+def load_body_info(path: Path, cache_dir: Path | None) -> BodyInfo:
+    """Parse a body file, reusing a cached result for identical content."""
+    data = path.read_bytes()
+    if cache_dir is None:
+        return parse_body(data.decode("utf-8"))
+
+    cache_file = cache_dir / f"{hashlib.sha256(data).hexdigest()}.json"
+    try:
+        cached_info = _body_info_from_cache(json.loads(cache_file.read_bytes()))
+    except (OSError, ValueError, KeyError, TypeError):
+        cached_info = None
+    if cached_info is not None:
+        return cached_info
+
+    info = parse_body(data.decode("utf-8"))
+    payload = {
+        "v": CACHE_VERSION,
+        "sections": sorted(info.sections),
+        "decision_id": info.decision_id,
+        "supersedes": info.supersedes_refs,
+        "invalid": info.supersedes_invalid,
+    }
+    # The cache only saves work; failing to write it must not fail validation.
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, cache_file)
+    except OSError:
+        pass
+    return info
 
 
 def parse_index(index_path: Path) -> tuple[list[tuple[str, str]], list[str]]:
@@ -155,15 +263,18 @@ def parse_index(index_path: Path) -> tuple[list[tuple[str, str]], list[str]]:
     in_index = False
     found_index_header = False
     in_html_comment = False
+    index_header_match = _INDEX_HEADER_RE.match
+    h2_any_match = _H2_ANY_RE.match
+    h3plus_match = _H3PLUS_RE.match
     for lineno, line in enumerate(text.splitlines(), start=1):
-        if re.match(r"^##\s+Decision Index", line):
+        if index_header_match(line):
             in_index = True
             found_index_header = True
             continue
         if in_index:
-            if re.match(r"^##(?!#)\s+", line):
+            if h2_any_match(line):
                 break
-            if re.match(r"^#{3,}\s+", line):
+            if h3plus_match(line):
                 continue
             stripped = line.strip()
             if in_html_comment:
@@ -193,8 +304,14 @@ def parse_index(index_path: Path) -> tuple[list[tuple[str, str]], list[str]]:
     return entries, errors
 
 
-def validate(repo_root: Path) -> list[str]:
-    """Run all validation checks and return a list of error messages."""
+def validate(
+    repo_root: Path, cache_dir: Path | None = None, jobs: int | None = None
+) -> list[str]:
+    """Run all validation checks and return a list of error messages.
+
+    When cache_dir is given, parsed body files are cached there by content hash.
+    Body files are read and parsed on up to `jobs` threads (None = auto).
+    """
     errors: list[str] = []
 
     decisions_dir = repo_root / "docs" / "decisions"
@@ -208,12 +325,25 @@ def validate(repo_root: Path) -> list[str]:
 
     # --- Collect body files ---
     body_files: dict[str, Path] = {}
-    body_repo_paths: dict[str, Path] = {}
-    if decisions_dir.exists():
-        for f in sorted(decisions_dir.iterdir()):
-            if f.is_file() and f.name not in SKIP_FILES and f.suffix == ".md":
-                body_files[f.name] = f
-                body_repo_paths[f"docs/decisions/{f.name}"] = f
+    # repo-relative path -> body file name
+    body_repo_names: dict[str, str] = {}
+    try:
+        with os.scandir(decisions_dir) as it:
+            # DirEntry.is_file() reuses the dirent type; ".md" alone has no suffix
+            body_names = sorted(
+                e.name
+                for e in it
+                if e.name.endswith(".md")
+                and e.name != ".md"
+                and e.name not in SKIP_FILES
+                and e.is_file()
+            )
+    except FileNotFoundError:
+        body_names = []
+    for name in body_names:
+        f = decisions_dir / name
+        body_files[name] = f
+        body_repo_names[_DECISIONS_PREFIX + name] = name
 
     template_path = decisions_dir / "_template.md"
     if not template_path.exists():
@@ -222,19 +352,27 @@ def validate(repo_root: Path) -> list[str]:
             "(required for AC1 validation)"
         )
     else:
-        template_sections = find_sections(template_path.read_text(encoding="utf-8"))
+        template_sections = parse_body(
+            template_path.read_text(encoding="utf-8")
+        ).sections
         for req in REQUIRED_SECTIONS:
             if req not in template_sections:
                 errors.append(
                     f"docs/decisions/_template.md: missing required section '## {req}'"
                 )
 
+    # --- Parse every body file once (reads overlap on worker threads) ---
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        parsed = executor.map(
+            lambda fpath: load_body_info(fpath, cache_dir), body_files.values()
+        )
+        body_infos: dict[str, BodyInfo] = dict(zip(body_files, parsed))
+
     # --- Collect all known Decision-IDs (from body files) ---
     body_decision_ids: dict[str, str] = {}
     all_decision_ids: dict[str, str] = {}
-    for fname, fpath in body_files.items():
-        text = fpath.read_text(encoding="utf-8")
-        did = extract_decision_id(text)
+    for fname, info in body_infos.items():
+        did = info.decision_id
         if not did:
             errors.append(
                 f"docs/decisions/{fname}: missing or invalid Decision-ID value "
@@ -254,9 +392,7 @@ def validate(repo_root: Path) -> list[str]:
         all_decision_ids[did] = fname
 
     # --- AC2: Check for duplicates in index ---
-    seen_ids: dict[str, int] = {}
-    for did, _ in index_entries:
-        seen_ids[did] = seen_ids.get(did, 0) + 1
+    seen_ids = Counter(did for did, _ in index_entries)
     for did, count in seen_ids.items():
         if count > 1:
             errors.append(
@@ -289,7 +425,8 @@ def validate(repo_root: Path) -> list[str]:
             )
             continue
 
-        resolved_repo_rel = str(PurePosixPath(*repo_rel.parts))
+        # parts are already normalised ("//" and "." dropped); no need to rebuild a path
+        resolved_repo_rel = "/".join(repo_rel.parts)
         resolved_path = repo_root.joinpath(*repo_rel.parts)
         index_files.add(resolved_repo_rel)
 
@@ -299,50 +436,45 @@ def validate(repo_root: Path) -> list[str]:
             )
             continue
 
-        if resolved_repo_rel not in body_repo_paths:
+        ref_fname = body_repo_names.get(resolved_repo_rel)
+        if ref_fname is None:
             errors.append(
                 f"Index references unmanaged file: {ref_path} (Decision-ID: {did})"
             )
             continue
 
-        fname = body_repo_paths[resolved_repo_rel].name
-        body_did = body_decision_ids.get(fname)
+        body_did = body_decision_ids.get(ref_fname)
         if body_did and body_did != did:
             errors.append(
                 f"Index/body Decision-ID mismatch: index has '{did}' but "
-                f"docs/decisions/{fname} has '{body_did}'"
+                f"docs/decisions/{ref_fname} has '{body_did}'"
             )
 
     # --- AC2: Check body -> index (orphan files) ---
-    for body_repo_rel in body_repo_paths:
+    for body_repo_rel, fname in body_repo_names.items():
         if body_repo_rel not in index_files:
-            fname = Path(body_repo_rel).name
             errors.append(
                 f"Body file not in index: docs/decisions/{fname} "
                 f"— add it to docs/decisions.md ## Decision Index"
             )
 
-    for fname, fpath in body_files.items():
-        text = fpath.read_text(encoding="utf-8")
-        sections = find_sections(text)
+    for fname, info in body_infos.items():
         for req in REQUIRED_SECTIONS:
-            if req not in sections:
+            if req not in info.sections:
                 errors.append(
                     f"docs/decisions/{fname}: missing required section '## {req}' "
                     f"(Rationale etc. — see _template.md)"
                 )
 
     # --- AC3: Check Supersedes references ---
-    for fname, fpath in body_files.items():
-        text = fpath.read_text(encoding="utf-8")
-        supersedes_refs, invalid_supersedes_entries = extract_supersedes(text)
-        for invalid_entry in invalid_supersedes_entries:
+    for fname, info in body_infos.items():
+        for invalid_entry in info.supersedes_invalid:
             errors.append(
                 f"docs/decisions/{fname}: invalid Supersedes entry '{invalid_entry}'. "
                 f"修正指針: D-YYYY-MM-DD-UPPER_SNAKE 形式のDecision-IDを指定してください。"
             )
 
-        for ref_id in supersedes_refs:
+        for ref_id in info.supersedes_refs:
             if ref_id not in all_decision_ids:
                 errors.append(
                     f"docs/decisions/{fname}: Supersedes references non-existent "
@@ -355,12 +487,31 @@ def validate(repo_root: Path) -> list[str]:
 
 
 def main() -> None:
-    if len(sys.argv) > 1:
-        repo_root = Path(sys.argv[1])
-    else:
-        repo_root = Path.cwd()
-
-    errors = validate(repo_root)
+    parser = argparse.ArgumentParser(
+        description="Validate Decision Snapshot index/body consistency."
+    )
+    parser.add_argument(
+        "repo_root", nargs="?", default="", help="Repo root (default: cwd)"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not read or write the parsed body cache",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=0,
+        help="Threads for reading body files (default: 0 = auto)",
+    )
+    args = parser.parse_args()
+    if args.jobs < 0:
+        parser.error("--jobs must be >= 0")
+
+    repo_root = Path(args.repo_root) if args.repo_root else Path.cwd()
+    cache_dir = None if args.no_cache else default_cache_dir()
+
+    errors = validate(repo_root, cache_dir, args.jobs or None)
     if errors:
         for err in errors:
             eprint(f"ERROR: {err}")
@@ -4,10 +4,33 @@ import argparse
 import json
 import os
 import sys
-from typing import Any, Dict, List, Optional
+from typing import AbstractSet, Any, Dict, List, Optional, Tuple
 
 STATUS_ALLOWED = {"Approved", "Approved with nits", "Blocked", "Question"}
 PRIORITY_ALLOWED = {"P0", "P1", "P2", "P3"}
+BLOCKING_PRIORITIES = frozenset({"P0", "P1"})
+
+# Key tuples are in schema order, which missing-key errors follow.
+REVIEW_KEY_ORDER = (
+    "schema_version",
+    "scope_id",
+    "status",
+    "findings",
+    "questions",
+    "overall_explanation",
+)
+FINDING_KEY_ORDER = ("title", "body", "priority", "code_location")
+CODE_LOCATION_KEY_ORDER = ("repo_relative_path", "line_range")
+LINE_RANGE_KEY_ORDER = ("start", "end")
+
+REVIEW_KEYS = frozenset(REVIEW_KEY_ORDER)
+FINDING_KEYS = frozenset(FINDING_KEY_ORDER)
+CODE_LOCATION_KEYS = frozenset(CODE_LOCATION_KEY_ORDER)
+LINE_RANGE_KEYS = frozenset(LINE_RANGE_KEY_ORDER)
+
+# Sorted once for error messages.
+_STATUS_SORTED = sorted(STATUS_ALLOWED)
+_PRIORITY_SORTED = sorted(PRIORITY_ALLOWED)
 
 
 def eprint(msg: str) -> None:
@@ -20,6 +43,10 @@ def die(errors: List[str]) -> int:
     return 1
 
 
+def in_key_order(order: Tuple[str, ...], keys: AbstractSet[str]) -> List[str]:
+    return [k for k in order if k in keys]
+
+
 def is_repo_relative_path(path: str) -> bool:
     if not path:
         return False
@@ -27,8 +54,8 @@ def is_repo_relative_path(path: str) -> bool:
         return False
     if path in {".", ".."}:
         return False
-    parts = [p for p in path.split("/") if p]
-    return ".." not in parts
+    # Any ".." segment sits at the start, at the end, or between two slashes.
+    return not (path.startswith("../") or path.endswith("/..") or "/../" in path)
 
 
 def validate_review(
@@ -37,21 +64,12 @@ def validate_review(
 ) -> List[str]:
     errors: List[str] = []
 
-    required = {
-        "schema_version",
-        "scope_id",
-        "status",
-        "findings",
-        "questions",
-        "overall_explanation",
-    }
-
-    missing = required - set(obj.keys())
+    missing = REVIEW_KEYS - obj.keys()
     if missing:
-        errors.append(f"missing keys: {sorted(missing)}")
+        errors.append(f"missing keys: {in_key_order(REVIEW_KEY_ORDER, missing)}")
         return errors
 
-    extra = set(obj.keys()) - required
+    extra = obj.keys() - REVIEW_KEYS
     if extra:
         errors.append(f"unexpected keys: {sorted(extra)}")
 
@@ -68,7 +86,7 @@ def validate_review(
 
     status = obj.get("status")
     if status not in STATUS_ALLOWED:
-        errors.append(f"status must be one of {sorted(STATUS_ALLOWED)}")
+        errors.append(f"status must be one of {_STATUS_SORTED}")
 
     findings = obj.get("findings")
     if not isinstance(findings, list):
@@ -86,17 +104,17 @@ def validate_review(
     if not isinstance(overall_explanation, str) or not overall_explanation:
         errors.append("overall_explanation must be a non-empty string")
 
-    # Validate findings
+    # Validate findings (and note P0/P1 ones for the status checks below)
+    has_blocking = False
     for idx, item in enumerate(findings):
         if not isinstance(item, dict):
             errors.append(f"findings[{idx}] is not an object")
             continue
-        required_finding_keys = {"title", "body", "priority", "code_location"}
-        for k in sorted(required_finding_keys):
+        for k in FINDING_KEY_ORDER:
             if k not in item:
                 errors.append(f"findings[{idx}] missing key: {k}")
 
-        extra_finding = set(item.keys()) - required_finding_keys
+        extra_finding = item.keys() - FINDING_KEYS
         if extra_finding:
             errors.append(f"findings[{idx}] unexpected keys: {sorted(extra_finding)}")
 
@@ -112,22 +130,21 @@ def validate_review(
 
         priority = item.get("priority")
         if not isinstance(priority, str) or priority not in PRIORITY_ALLOWED:
-            errors.append(
-                f"findings[{idx}].priority must be one of {sorted(PRIORITY_ALLOWED)}"
-            )
+            errors.append(f"findings[{idx}].priority must be one of {_PRIORITY_SORTED}")
+        elif priority in BLOCKING_PRIORITIES:
+            has_blocking = True
 
         code_location = item.get("code_location")
         if not isinstance(code_location, dict):
             errors.append(f"findings[{idx}].code_location must be an object")
             continue
 
-        required_code_location_keys = {"repo_relative_path", "line_range"}
-        missing_code_location = required_code_location_keys - set(code_location.keys())
+        missing_code_location = CODE_LOCATION_KEYS - code_location.keys()
         if missing_code_location:
             errors.append(
-                f"findings[{idx}].code_location missing keys: {sorted(missing_code_location)}"
+                f"findings[{idx}].code_location missing keys: {in_key_order(CODE_LOCATION_KEY_ORDER, missing_code_location)}"
             )
-        extra_code_location = set(code_location.keys()) - required_code_location_keys
+        extra_code_location = code_location.keys() - CODE_LOCATION_KEYS
         if extra_code_location:
             errors.append(
                 f"findings[{idx}].code_location unexpected keys: {sorted(extra_code_location)}"
@@ -146,13 +163,12 @@ def validate_review(
             errors.append(f"findings[{idx}].code_location.line_range must be an object")
             continue
 
-        required_line_range_keys = {"start", "end"}
-        missing_line_range = required_line_range_keys - set(line_range.keys())
+        missing_line_range = LINE_RANGE_KEYS - line_range.keys()
         if missing_line_range:
             errors.append(
-                f"findings[{idx}].code_location.line_range missing keys: {sorted(missing_line_range)}"
+                f"findings[{idx}].code_location.line_range missing keys: {in_key_order(LINE_RANGE_KEY_ORDER, missing_line_range)}"
             )
-        extra_line_range = set(line_range.keys()) - required_line_range_keys
+        extra_line_range = line_range.keys() - LINE_RANGE_KEYS
         if extra_line_range:
             errors.append(
                 f"findings[{idx}].code_location.line_range unexpected keys: {sorted(extra_line_range)}"
@@ -181,23 +197,13 @@ def validate_review(
             errors.append("Approved must have questions=[]")
 
     if status == "Approved with nits":
-        blocking = [
-            f
-            for f in findings
-            if isinstance(f, dict) and f.get("priority") in ("P0", "P1")
-        ]
-        if blocking:
+        if has_blocking:
             errors.append("Approved with nits must not include P0/P1 findings")
         if len(questions) != 0:
             errors.append("Approved with nits must have questions=[]")
 
     if status == "Blocked":
-        blocking = [
-            f
-            for f in findings
-            if isinstance(f, dict) and f.get("priority") in ("P0", "P1")
-        ]
-        if not blocking:
+        if not has_blocking:
             errors.append("Blocked must include at least one P0/P1 finding")
 
     if status == "Question":
@@ -238,11 +244,22 @@ def main() -> int:
         return die(errors)
 
     if args.format:
+        # Encode up front so the temp file gets one write and never holds a
+        # partial document if encoding fails.
+        payload = (json.dumps(data, ensure_ascii=False, indent=2) + "\n").encode(
+            "utf-8"
+        )
         tmp = f"{args.path}.tmp.{os.getpid()}"
-        with open(tmp, "w", encoding="utf-8") as fh:
-            json.dump(data, fh, ensure_ascii=False, indent=2)
-            fh.write("\n")
-        os.replace(tmp, args.path)
+        try:
+            with open(tmp, "wb") as fh:
+                fh.write(payload)
+            os.replace(tmp, args.path)
+        except OSError:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
 
     print(f"OK: {args.path}")
     return 0